@@ -22,6 +22,7 @@ from database.queries import (
     list_orders,
     list_product_categories,
     list_products,
+    list_service_request_rows,
     list_service_requests,
     list_specialists,
     list_users,
@@ -59,6 +60,7 @@ __all__ = [
     "create_service_request",
     "get_service_request_by_id",
     "list_service_requests",
+    "list_service_request_rows",
     "update_service_request_status",
     "assign_specialist",
     "delete_service_request",
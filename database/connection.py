@@ -1,6 +1,7 @@
 """Database connection management module."""
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -10,21 +11,57 @@ DB_PATH = Path(__file__).parent / "ctrlmarket.db"
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 SEED_DATA_PATH = Path(__file__).parent / "seed_data.sql"
 
+# Each thread keeps one open connection so sqlite's per-connection statement
+# cache survives between queries. Bumping the generation (when the database
+# file is recreated) makes every thread reopen its connection.
+_local = threading.local()
+_generation = 0
+
+
+def _thread_connection() -> sqlite3.Connection:
+    """Return this thread's connection to DB_PATH, reopening it if stale."""
+    key = (DB_PATH, _generation)
+    if getattr(_local, "key", None) != key:
+        if getattr(_local, "conn", None) is not None:
+            _local.conn.close()
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        _local.conn = conn
+        _local.key = key
+    return _local.conn
+
+
+def _invalidate_connections() -> None:
+    """Make every thread reopen its connection on next use."""
+    global _generation
+    _generation += 1
+    if getattr(_local, "conn", None) is not None:
+        _local.conn.close()
+        _local.conn = None
+        _local.key = None
+
 
 @contextmanager
 def get_db_connection():
-    """Get a database connection with proper configuration."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    """Get this thread's database connection as a transaction.
+
+    The outermost block commits on success and rolls back on error; nested
+    blocks on the same thread join the enclosing transaction.
+    """
+    conn = _thread_connection()
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
     try:
         yield conn
-        conn.commit()
+        if depth == 0:
+            conn.commit()
     except Exception:
-        conn.rollback()
+        if depth == 0:
+            conn.rollback()
         raise
     finally:
-        conn.close()
+        _local.depth = depth
 
 
 def init_database():
@@ -39,8 +76,22 @@ def init_database():
                 # Check if there's data
                 cursor = conn.execute("SELECT COUNT(*) as count FROM User")
                 if cursor.fetchone()["count"] > 0:
+                    has_search = conn.execute(
+                        "SELECT 1 FROM sqlite_master WHERE name='ProductSearch'"
+                    ).fetchone()
+                    # Schema is idempotent; re-apply it so new indexes are added
+                    with open(SCHEMA_PATH, "r") as f:
+                        conn.executescript(f.read())
+                    if not has_search:
+                        # A new search index starts empty; fill it from Product
+                        conn.execute(
+                            "INSERT INTO ProductSearch(ProductSearch) VALUES('rebuild')"
+                        )
                     return False  # Database already initialized
 
+    # A new file; connections opened on a previous one must not be reused
+    _invalidate_connections()
+
     # Create schema
     with get_db_connection() as conn:
         with open(SCHEMA_PATH, "r") as f:
@@ -56,6 +107,7 @@ def init_database():
 
 def reset_database():
     """Reset the database (delete and reinitialize)."""
+    _invalidate_connections()
     if DB_PATH.exists():
         DB_PATH.unlink()
     return init_database()
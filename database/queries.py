@@ -1,6 +1,7 @@
 """Database query operations - Raw SQL with parameterized queries."""
 
 import sqlite3
+import sys
 from datetime import datetime
 from typing import Optional
 
@@ -9,6 +10,7 @@ from models import (
     LoginCredentials,
     OrderCreate,
     OrderItemWithProduct,
+    OrderRow,
     OrderUpdateStatus,
     OrderWithItems,
     Product,
@@ -16,11 +18,13 @@ from models import (
     ProductUpdate,
     ServiceRequest,
     ServiceRequestCreate,
+    ServiceRequestRow,
     ServiceRequestUpdateStatus,
     ServiceRequestWithDetails,
     SessionUser,
     User,
     UserCreate,
+    UserRow,
     UserUpdate,
 )
 
@@ -109,10 +113,25 @@ def get_user_by_email(email: str) -> Optional[User]:
         return User(**dict(row)) if row else None
 
 
-def list_users(role: Optional[str] = None, search: Optional[str] = None) -> list[User]:
-    """List all users with optional filtering."""
+def list_users(
+    role: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    as_tuples: bool = False,
+) -> list[User] | list[UserRow]:
+    """List all users with optional filtering.
+
+    Users are ordered by name. When ``limit`` is given the results are ordered
+    by ``user_id`` instead, so the last ID of a page can be passed as
+    ``after_id`` to fetch the next one (keyset pagination). With ``as_tuples``
+    the table columns are returned as ``UserRow`` tuples without validation.
+    """
     with get_db_connection() as conn:
-        query = "SELECT * FROM User WHERE 1=1"
+        if as_tuples:
+            query = "SELECT user_id, name, email, phone, role FROM User WHERE 1=1"
+        else:
+            query = "SELECT * FROM User WHERE 1=1"
         params = []
 
         if role:
@@ -124,10 +143,20 @@ def list_users(role: Optional[str] = None, search: Optional[str] = None) -> list
             search_pattern = f"%{search}%"
             params.extend([search_pattern, search_pattern, search_pattern])
 
-        query += " ORDER BY name"
+        if after_id is not None:
+            query += " AND user_id > ?"
+            params.append(after_id)
+
+        if limit is not None:
+            query += " ORDER BY user_id LIMIT ?"
+            params.append(limit)
+        else:
+            query += " ORDER BY name"
 
         cursor = conn.execute(query, params)
-        return [User(**dict(row)) for row in cursor.fetchall()]
+        if as_tuples:
+            return [UserRow._make(row) for row in cursor]
+        return [User(**dict(row)) for row in cursor]
 
 
 def update_user(user_id: int, user: UserUpdate) -> Optional[User]:
@@ -227,9 +256,17 @@ def get_product_by_id(
 
 
 def list_products(
-    category: Optional[str] = None, search: Optional[str] = None
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
 ) -> list[Product]:
-    """List all products with optional filtering."""
+    """List all products with optional filtering.
+
+    Products are ordered by name. When ``limit`` is given they are ordered by
+    ``product_id`` instead, so the last ID of a page can be passed as
+    ``after_id`` to fetch the next one (keyset pagination).
+    """
     with get_db_connection() as conn:
         query = "SELECT * FROM Product WHERE 1=1"
         params = []
@@ -238,22 +275,38 @@ def list_products(
             query += " AND category = ?"
             params.append(category)
 
-        if search:
+        if search and len(search) >= 3:
+            # Trigram index lookup; same matches as the LIKE below
+            query += (
+                " AND product_id IN"
+                " (SELECT rowid FROM ProductSearch WHERE ProductSearch MATCH ?)"
+            )
+            params.append('"' + search.replace('"', '""') + '"')
+        elif search:
+            # Trigrams need at least three characters
             query += " AND (name LIKE ? OR category LIKE ?)"
             search_pattern = f"%{search}%"
             params.extend([search_pattern, search_pattern])
 
-        query += " ORDER BY name"
+        if after_id is not None:
+            query += " AND product_id > ?"
+            params.append(after_id)
+
+        if limit is not None:
+            query += " ORDER BY product_id LIMIT ?"
+            params.append(limit)
+        else:
+            query += " ORDER BY name"
 
         cursor = conn.execute(query, params)
-        return [Product(**dict(row)) for row in cursor.fetchall()]
+        return [Product(**dict(row)) for row in cursor]
 
 
 def list_product_categories() -> list[str]:
     """List all unique product categories."""
     with get_db_connection() as conn:
         cursor = conn.execute("SELECT DISTINCT category FROM Product ORDER BY category")
-        return [row["category"] for row in cursor.fetchall()]
+        return [row["category"] for row in cursor]
 
 
 def update_product(product_id: int, product: ProductUpdate) -> Optional[Product]:
@@ -355,9 +408,15 @@ def create_order(order_data: OrderCreate) -> Optional[OrderWithItems]:
 
 
 def get_order_by_id(
-    order_id: int, conn: Optional[sqlite3.Connection] = None
+    order_id: int,
+    conn: Optional[sqlite3.Connection] = None,
+    with_items: bool = True,
 ) -> Optional[OrderWithItems]:
-    """Get order by ID with items."""
+    """Get order by ID with items.
+
+    Pass ``with_items=False`` when only the order row is needed (e.g. to
+    check its owner or status); ``items`` is then left empty.
+    """
 
     def _fetch_order(connection: sqlite3.Connection) -> Optional[OrderWithItems]:
         # Get order details
@@ -373,6 +432,15 @@ def get_order_by_id(
         row = cursor.fetchone()
         if not row:
             return None
+        if not with_items:
+            return OrderWithItems(
+                order_id=row["order_id"],
+                order_date=row["order_date"],
+                total_price=row["total_price"],
+                status=row["status"],
+                user_id=row["user_id"],
+                customer_name=row["customer_name"],
+            )
 
         # Get order items with product details
         items_cursor = connection.execute(
@@ -414,87 +482,162 @@ def get_order_by_id(
         return _fetch_order(conn)
 
 
+def _order_filters(
+    user_id: Optional[int] = None,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> tuple[str, list]:
+    """Build the WHERE/ORDER BY/LIMIT clause shared by order listings."""
+    query = " WHERE 1=1"
+    params: list = []
+
+    if user_id:
+        query += " AND o.user_id = ?"
+        params.append(user_id)
+
+    if status:
+        query += " AND o.status = ?"
+        params.append(status)
+
+    if search:
+        query += " AND (u.name LIKE ? OR o.order_id LIKE ?)"
+        search_pattern = f"%{search}%"
+        params.extend([search_pattern, search_pattern])
+
+    if after_id is not None:
+        query += " AND o.order_id < ?"
+        params.append(after_id)
+
+    if limit is not None:
+        query += " ORDER BY o.order_id DESC LIMIT ?"
+        params.append(limit)
+    else:
+        query += " ORDER BY o.order_date DESC"
+
+    return query, params
+
+
 def list_orders(
     user_id: Optional[int] = None,
     status: Optional[str] = None,
     search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
 ) -> list[OrderWithItems]:
-    """List all orders with optional filtering."""
+    """List all orders with optional filtering.
+
+    Orders are newest first by date. When ``limit`` is given they are ordered
+    by ``order_id`` descending instead, so the last ID of a page can be passed
+    as ``after_id`` to fetch the next (older) one (keyset pagination).
+
+    Items are not loaded; each order carries ``item_count`` instead. Use
+    ``get_order_by_id`` for an order's items.
+    """
     with get_db_connection() as conn:
-        query = """
-            SELECT o.*, u.name as customer_name
+        filters, params = _order_filters(
+            user_id=user_id,
+            status=status,
+            search=search,
+            limit=limit,
+            after_id=after_id,
+        )
+        query = (
+            """
+            SELECT
+                o.*,
+                u.name as customer_name,
+                (
+                    SELECT COUNT(*) FROM OrderItem oi
+                    WHERE oi.order_id = o.order_id
+                ) as item_count
             FROM "Order" o
             JOIN User u ON o.user_id = u.user_id
-            WHERE 1=1
-        """
-        params = []
-
-        if user_id:
-            query += " AND o.user_id = ?"
-            params.append(user_id)
+            """
+            + filters
+        )
 
-        if status:
-            query += " AND o.status = ?"
-            params.append(status)
+        cursor = conn.execute(query, params)
+        return [
+            OrderWithItems(
+                order_id=row["order_id"],
+                order_date=row["order_date"],
+                total_price=row["total_price"],
+                status=row["status"],
+                user_id=row["user_id"],
+                customer_name=row["customer_name"],
+                item_count=row["item_count"],
+            )
+            for row in cursor
+        ]
 
-        if search:
-            query += " AND (u.name LIKE ? OR o.order_id LIKE ?)"
-            search_pattern = f"%{search}%"
-            params.extend([search_pattern, search_pattern])
 
-        query += " ORDER BY o.order_date DESC"
+def list_order_rows(
+    user_id: Optional[int] = None,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> list[OrderRow]:
+    """List orders as lightweight rows for read-only tables.
+
+    Filters and orders like ``list_orders`` but skips Pydantic validation and
+    returns the order date pre-formatted as ``YYYY-MM-DD HH:MM`` and the total
+    as ``$0.00``.
+    """
+    with get_db_connection() as conn:
+        filters, params = _order_filters(
+            user_id=user_id,
+            status=status,
+            search=search,
+            limit=limit,
+            after_id=after_id,
+        )
+        query = (
+            """
+            SELECT
+                o.order_id,
+                strftime('%Y-%m-%d %H:%M', o.order_date) as order_date,
+                u.name as customer_name,
+                printf('$%.2f', COALESCE(o.total_price, 0)) as total,
+                (
+                    SELECT COUNT(*) FROM OrderItem oi
+                    WHERE oi.order_id = o.order_id
+                ) as item_count,
+                o.status,
+                o.user_id
+            FROM "Order" o
+            JOIN User u ON o.user_id = u.user_id
+            """
+            + filters
+        )
 
         cursor = conn.execute(query, params)
-        orders = []
-
-        for row in cursor.fetchall():
-            # Get items for each order
-            items_cursor = conn.execute(
-                """
-                SELECT oi.*, p.name as product_name, p.category as product_category
-                FROM OrderItem oi
-                JOIN Product p ON oi.product_id = p.product_id
-                WHERE oi.order_id = ?
-                """,
-                (row["order_id"],),
-            )
-            items = [
-                OrderItemWithProduct(
-                    order_item_id=item["order_item_id"],
-                    order_id=item["order_id"],
-                    quantity=item["quantity"],
-                    unit_price=item["unit_price"],
-                    product_id=item["product_id"],
-                    product_name=item["product_name"],
-                    product_category=item["product_category"],
-                )
-                for item in items_cursor.fetchall()
-            ]
-
-            orders.append(
-                OrderWithItems(
-                    order_id=row["order_id"],
-                    order_date=row["order_date"],
-                    total_price=row["total_price"],
-                    status=row["status"],
-                    user_id=row["user_id"],
-                    customer_name=row["customer_name"],
-                    items=items,
-                )
-            )
-
-        return orders
+        # Intern statuses so cached rows share one string per status value.
+        return [
+            OrderRow(*head, sys.intern(status), user_id)
+            for *head, status, user_id in cursor
+        ]
 
 
 def update_order_status(
-    order_id: int, update: OrderUpdateStatus
+    order_id: int,
+    update: OrderUpdateStatus,
+    from_statuses: Optional[tuple[str, ...]] = None,
 ) -> Optional[OrderWithItems]:
-    """Update order status."""
+    """Update order status.
+
+    With ``from_statuses``, only an order currently in one of those statuses
+    is updated; otherwise ``None`` is returned.
+    """
     with get_db_connection() as conn:
-        cursor = conn.execute(
-            'UPDATE "Order" SET status = ? WHERE order_id = ?',
-            (update.status, order_id),
-        )
+        query = 'UPDATE "Order" SET status = ? WHERE order_id = ?'
+        params: list = [update.status, order_id]
+        if from_statuses:
+            query += f" AND status IN ({', '.join('?' * len(from_statuses))})"
+            params.extend(from_statuses)
+        cursor = conn.execute(query, params)
         if cursor.rowcount == 0:
             return None
 
@@ -580,15 +723,87 @@ def get_service_request_by_id(
         return _fetch_request(conn)
 
 
+def _service_request_filters(
+    status: Optional[str] = None,
+    customer_id: Optional[int] = None,
+    specialist_id: Optional[int] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    available_to_specialist: Optional[int] = None,
+) -> tuple[str, list]:
+    """Build the WHERE/ORDER BY/LIMIT clause shared by service request listings."""
+    query = " WHERE 1=1"
+    params: list = []
+
+    if status:
+        query += " AND sr.status = ?"
+        params.append(status)
+
+    if customer_id:
+        query += " AND sr.customer_id = ?"
+        params.append(customer_id)
+
+    if specialist_id is not None:
+        if specialist_id == 0:  # Filter for unassigned
+            query += " AND sr.specialist_id IS NULL"
+        else:
+            query += " AND sr.specialist_id = ?"
+            params.append(specialist_id)
+
+    if available_to_specialist is not None:
+        # Unassigned or assigned to this specialist. Written as one
+        # expression so pages are read in request_id order in a single pass,
+        # rather than merging two specialist_id index ranges and sorting.
+        query += " AND COALESCE(sr.specialist_id, ?) = ?"
+        params.extend([available_to_specialist, available_to_specialist])
+
+    if search:
+        query += " AND (c.name LIKE ? OR sr.service_type LIKE ?)"
+        search_pattern = f"%{search}%"
+        params.extend([search_pattern, search_pattern])
+
+    if after_id is not None:
+        query += " AND sr.request_id < ?"
+        params.append(after_id)
+
+    if limit is not None:
+        query += " ORDER BY sr.request_id DESC LIMIT ?"
+        params.append(limit)
+    else:
+        query += " ORDER BY sr.request_date DESC"
+
+    return query, params
+
+
 def list_service_requests(
     status: Optional[str] = None,
     customer_id: Optional[int] = None,
     specialist_id: Optional[int] = None,
     search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    available_to_specialist: Optional[int] = None,
 ) -> list[ServiceRequestWithDetails]:
-    """List all service requests with optional filtering."""
+    """List all service requests with optional filtering.
+
+    Requests are newest first by date. When ``limit`` is given they are
+    ordered by ``request_id`` descending instead, so the last ID of a page can
+    be passed as ``after_id`` to fetch the next (older) one (keyset
+    pagination), and deep pages never scan and discard earlier rows.
+    """
     with get_db_connection() as conn:
-        query = """
+        filters, params = _service_request_filters(
+            status=status,
+            customer_id=customer_id,
+            specialist_id=specialist_id,
+            search=search,
+            limit=limit,
+            after_id=after_id,
+            available_to_specialist=available_to_specialist,
+        )
+        query = (
+            """
             SELECT 
                 sr.*,
                 c.name as customer_name,
@@ -596,31 +811,9 @@ def list_service_requests(
             FROM ServiceRequest sr
             JOIN User c ON sr.customer_id = c.user_id
             LEFT JOIN User s ON sr.specialist_id = s.user_id
-            WHERE 1=1
-        """
-        params = []
-
-        if status:
-            query += " AND sr.status = ?"
-            params.append(status)
-
-        if customer_id:
-            query += " AND sr.customer_id = ?"
-            params.append(customer_id)
-
-        if specialist_id is not None:
-            if specialist_id == 0:  # Filter for unassigned
-                query += " AND sr.specialist_id IS NULL"
-            else:
-                query += " AND sr.specialist_id = ?"
-                params.append(specialist_id)
-
-        if search:
-            query += " AND (c.name LIKE ? OR sr.service_type LIKE ?)"
-            search_pattern = f"%{search}%"
-            params.extend([search_pattern, search_pattern])
-
-        query += " ORDER BY sr.request_date DESC"
+            """
+            + filters
+        )
 
         cursor = conn.execute(query, params)
 
@@ -635,19 +828,79 @@ def list_service_requests(
                 customer_name=row["customer_name"],
                 specialist_name=row["specialist_name"],
             )
-            for row in cursor.fetchall()
+            for row in cursor
+        ]
+
+
+def list_service_request_rows(
+    status: Optional[str] = None,
+    customer_id: Optional[int] = None,
+    specialist_id: Optional[int] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    available_to_specialist: Optional[int] = None,
+) -> list[ServiceRequestRow]:
+    """List service requests as lightweight rows for read-only tables.
+
+    Filters like ``list_service_requests`` but skips Pydantic validation and
+    returns the request date pre-formatted as ``YYYY-MM-DD HH:MM``. Use
+    ``available_to_specialist`` to list unassigned requests plus those assigned
+    to the given specialist.
+    """
+    with get_db_connection() as conn:
+        filters, params = _service_request_filters(
+            status=status,
+            customer_id=customer_id,
+            specialist_id=specialist_id,
+            search=search,
+            limit=limit,
+            after_id=after_id,
+            available_to_specialist=available_to_specialist,
+        )
+        query = (
+            """
+            SELECT
+                sr.request_id,
+                strftime('%Y-%m-%d %H:%M', sr.request_date) as request_date,
+                sr.service_type,
+                sr.status,
+                c.name as customer_name,
+                s.name as specialist_name
+            FROM ServiceRequest sr
+            JOIN User c ON sr.customer_id = c.user_id
+            LEFT JOIN User s ON sr.specialist_id = s.user_id
+            """
+            + filters
+        )
+
+        cursor = conn.execute(query, params)
+        # Intern statuses so cached rows share one string per status value.
+        return [
+            ServiceRequestRow(
+                request_id, request_date, service_type, sys.intern(status), *names
+            )
+            for request_id, request_date, service_type, status, *names in cursor
         ]
 
 
 def update_service_request_status(
-    request_id: int, update: ServiceRequestUpdateStatus
+    request_id: int,
+    update: ServiceRequestUpdateStatus,
+    from_statuses: Optional[tuple[str, ...]] = None,
 ) -> Optional[ServiceRequestWithDetails]:
-    """Update service request status."""
+    """Update service request status.
+
+    With ``from_statuses``, only a request currently in one of those statuses
+    is updated; otherwise ``None`` is returned.
+    """
     with get_db_connection() as conn:
-        cursor = conn.execute(
-            "UPDATE ServiceRequest SET status = ? WHERE request_id = ?",
-            (update.status, request_id),
-        )
+        query = "UPDATE ServiceRequest SET status = ? WHERE request_id = ?"
+        params: list = [update.status, request_id]
+        if from_statuses:
+            query += f" AND status IN ({', '.join('?' * len(from_statuses))})"
+            params.extend(from_statuses)
+        cursor = conn.execute(query, params)
         if cursor.rowcount == 0:
             return None
 
@@ -684,32 +937,15 @@ def delete_service_request(request_id: int) -> bool:
 
 def list_service_requests_for_specialist(
     specialist_id: int,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
 ) -> list[ServiceRequestWithDetails]:
-    """List service requests for a specialist (unassigned or assigned to them)."""
-    with get_db_connection() as conn:
-        query = """
-            SELECT 
-                sr.*,
-                c.name as customer_name,
-                s.name as specialist_name
-            FROM ServiceRequest sr
-            JOIN User c ON sr.customer_id = c.user_id
-            LEFT JOIN User s ON sr.specialist_id = s.user_id
-            WHERE sr.specialist_id IS NULL OR sr.specialist_id = ?
-            ORDER BY sr.request_date DESC
-        """
-        cursor = conn.execute(query, (specialist_id,))
-
-        return [
-            ServiceRequestWithDetails(
-                request_id=row["request_id"],
-                service_type=row["service_type"],
-                request_date=row["request_date"],
-                status=row["status"],
-                customer_id=row["customer_id"],
-                specialist_id=row["specialist_id"],
-                customer_name=row["customer_name"],
-                specialist_name=row["specialist_name"],
-            )
-            for row in cursor.fetchall()
-        ]
+    """List service requests for a specialist (unassigned or assigned to them).
+
+    Filtering happens in SQL; results are ordered like ``list_service_requests``.
+    """
+    return list_service_requests(
+        status=status,
+        search=search,
+        available_to_specialist=specialist_id,
+    )
@@ -77,3 +77,33 @@ CREATE INDEX IF NOT EXISTS idx_servicereq_customer ON ServiceRequest(customer_id
 CREATE INDEX IF NOT EXISTS idx_servicereq_specialist ON ServiceRequest(specialist_id);
 CREATE INDEX IF NOT EXISTS idx_servicereq_status ON ServiceRequest(status);
 CREATE INDEX IF NOT EXISTS idx_product_category ON Product(category);
+CREATE INDEX IF NOT EXISTS idx_user_role ON User(role);
+CREATE INDEX IF NOT EXISTS idx_user_role_name ON User(role, name);
+
+-- ============================================
+-- Product search index (substring search on name/category)
+-- ============================================
+CREATE VIRTUAL TABLE IF NOT EXISTS ProductSearch USING fts5(
+    name,
+    category,
+    content='Product',
+    content_rowid='product_id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_product_search_insert AFTER INSERT ON Product BEGIN
+    INSERT INTO ProductSearch(rowid, name, category)
+    VALUES (new.product_id, new.name, new.category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_product_search_delete AFTER DELETE ON Product BEGIN
+    INSERT INTO ProductSearch(ProductSearch, rowid, name, category)
+    VALUES ('delete', old.product_id, old.name, old.category);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_product_search_update AFTER UPDATE ON Product BEGIN
+    INSERT INTO ProductSearch(ProductSearch, rowid, name, category)
+    VALUES ('delete', old.product_id, old.name, old.category);
+    INSERT INTO ProductSearch(rowid, name, category)
+    VALUES (new.product_id, new.name, new.category);
+END;
@@ -1,7 +1,7 @@
 """Models module - Pydantic models for all entities."""
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, NamedTuple, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -23,6 +23,16 @@ class User(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserRow(NamedTuple):
+    """Lightweight user row for read-only listings (no validation)."""
+
+    user_id: int
+    name: str
+    email: str
+    phone: str
+    role: str
+
+
 class UserCreate(UserBase):
     """User model for creation (includes plain password)."""
 
@@ -129,6 +139,19 @@ class OrderWithItems(Order):
 
     items: list = []
     customer_name: Optional[str] = None
+    item_count: Optional[int] = None
+
+
+class OrderRow(NamedTuple):
+    """Lightweight order row for read-only listings (no validation)."""
+
+    order_id: int
+    order_date: Optional[str]
+    customer_name: str
+    total: str
+    item_count: int
+    status: str
+    user_id: int
 
 
 class OrderCreate(BaseModel):
@@ -169,6 +192,17 @@ class ServiceRequestWithDetails(ServiceRequest):
     specialist_name: Optional[str] = None
 
 
+class ServiceRequestRow(NamedTuple):
+    """Lightweight service request row for read-only listings (no validation)."""
+
+    request_id: int
+    request_date: str
+    service_type: str
+    status: str
+    customer_name: str
+    specialist_name: Optional[str]
+
+
 class ServiceRequestCreate(BaseModel):
     """Service request model for creation."""
 
@@ -193,6 +227,7 @@ class SessionUser(BaseModel):
 
 __all__ = [
     "User",
+    "UserRow",
     "UserCreate",
     "UserUpdate",
     "LoginCredentials",
@@ -203,6 +238,7 @@ __all__ = [
     "Order",
     "OrderCreate",
     "OrderWithItems",
+    "OrderRow",
     "OrderItem",
     "OrderItemCreate",
     "OrderItemWithProduct",
@@ -210,5 +246,6 @@ __all__ = [
     "ServiceRequest",
     "ServiceRequestCreate",
     "ServiceRequestWithDetails",
+    "ServiceRequestRow",
     "ServiceRequestUpdateStatus",
 ]
@@ -137,6 +137,66 @@ class TestDatabaseInitialization:
             if temp_db.exists():
                 temp_db.unlink()
 
+    def test_init_database_adds_missing_indexes(self, tmp_path: Path):
+        """Test that init_database adds new indexes to an existing database."""
+        import database.connection as conn_module
+
+        original_path = conn_module.DB_PATH
+        temp_db = tmp_path / "init_index_test.db"
+        conn_module.DB_PATH = temp_db
+
+        try:
+            init_database()
+
+            conn = sqlite3.connect(temp_db)
+            conn.execute("DROP INDEX idx_user_role_name")
+            conn.commit()
+            conn.close()
+
+            assert init_database() is False
+
+            conn = sqlite3.connect(temp_db)
+            cursor = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND name=?",
+                ("idx_user_role_name",),
+            )
+            assert cursor.fetchone() is not None
+            conn.close()
+        finally:
+            conn_module.DB_PATH = original_path
+            if temp_db.exists():
+                temp_db.unlink()
+
+    def test_init_database_builds_product_search(self, tmp_path: Path):
+        """Test that init_database fills a search index added to an existing db."""
+        import database.connection as conn_module
+
+        original_path = conn_module.DB_PATH
+        temp_db = tmp_path / "init_search_test.db"
+        conn_module.DB_PATH = temp_db
+
+        try:
+            init_database()
+
+            conn = sqlite3.connect(temp_db)
+            conn.execute("DROP TABLE ProductSearch")
+            conn.commit()
+            conn.close()
+
+            assert init_database() is False
+
+            conn = sqlite3.connect(temp_db)
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM ProductSearch WHERE ProductSearch MATCH ?",
+                ('"smart"',),
+            )
+            assert cursor.fetchone()[0] > 0
+            conn.close()
+        finally:
+            conn_module.DB_PATH = original_path
+            if temp_db.exists():
+                temp_db.unlink()
+
     def test_reset_database_deletes_and_reinitializes(self, tmp_path: Path):
         """Test that reset_database deletes and reinitializes."""
         import database.connection as conn_module
@@ -205,3 +265,4 @@ class TestDatabaseSchema:
             assert "idx_servicereq_specialist" in indexes
             assert "idx_servicereq_status" in indexes
             assert "idx_product_category" in indexes
+            assert "idx_user_role_name" in indexes
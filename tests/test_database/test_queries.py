@@ -1,7 +1,10 @@
 """Database queries tests - CRUD operations for all entities."""
 
+import sys
+
 import pytest
 from database import queries
+from database.connection import get_db_connection
 from models import (
     LoginCredentials,
     OrderCreate,
@@ -16,6 +19,32 @@ from models import (
 )
 
 
+def _traced_selects(fn) -> list[str]:
+    """Run ``fn`` and return the SELECT statements it executed."""
+    statements: list[str] = []
+    with get_db_connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            fn()
+        finally:
+            conn.set_trace_callback(None)
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+def _count_selects(fn) -> int:
+    """Run ``fn`` and return how many SELECT statements it executed."""
+    return len(_traced_selects(fn))
+
+
+def _query_plans(fn) -> list[str]:
+    """Run ``fn`` and return the query plan of each SELECT it executed."""
+    with get_db_connection() as conn:
+        return [
+            " / ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+            for sql in _traced_selects(fn)
+        ]
+
+
 class TestAuthenticationQueries:
     """Test authentication-related queries."""
 
@@ -166,6 +195,39 @@ class TestUserQueries:
         users = queries.list_users(search="@ctrlmarket.com")
         assert len(users) >= 3  # admin + specialists
 
+    def test_list_users_keyset_pagination(self, mock_db_path):
+        """Test paging through users with limit and after_id."""
+        all_ids = sorted(u.user_id for u in queries.list_users())
+
+        first_page = queries.list_users(limit=4)
+        assert [u.user_id for u in first_page] == all_ids[:4]
+
+        second_page = queries.list_users(limit=4, after_id=first_page[-1].user_id)
+        assert [u.user_id for u in second_page] == all_ids[4:8]
+
+    def test_list_users_page_uses_index_order(self, mock_db_path):
+        """Test user pages are read in ID order, without a sort step."""
+        for filters in ({}, {"role": "Customer"}):
+            for plan in _query_plans(
+                lambda filters=filters: queries.list_users(
+                    limit=100, after_id=2, as_tuples=True, **filters
+                )
+            ):
+                assert "TEMP B-TREE" not in plan
+
+    def test_list_users_by_role_uses_name_order(self, mock_db_path):
+        """Test unpaged role listings, used by the pickers, need no sort step."""
+        for plan in _query_plans(lambda: queries.list_specialists()):
+            assert "TEMP B-TREE" not in plan
+
+    def test_list_users_as_tuples(self, mock_db_path):
+        """Test listing users as lightweight rows."""
+        users = queries.list_users(role="Customer")
+        rows = queries.list_users(role="Customer", as_tuples=True)
+        assert [tuple(r) for r in rows] == [
+            (u.user_id, u.name, u.email, u.phone, u.role) for u in users
+        ]
+
     def test_list_customers(self, mock_db_path):
         """Test listing customers specifically."""
         customers = queries.list_customers()
@@ -328,6 +390,44 @@ class TestProductQueries:
         products = queries.list_products(search="Smart")
         assert len(products) >= 3
 
+    def test_list_products_search_matches_substrings(self, mock_db_path):
+        """Test indexed search matches substrings case-insensitively."""
+        products = queries.list_products(search="MART")
+        assert {p.name for p in products} >= {"Smart Door Lock", "Smart Light Hub"}
+
+        queries.update_product(products[0].product_id, ProductUpdate(name="Renamed"))
+        renamed = queries.list_products(search="renam")
+        assert [p.product_id for p in renamed] == [products[0].product_id]
+
+    def test_list_products_search_within_category(self, mock_db_path):
+        """Test indexed search combines with the category filter."""
+        expected = [
+            p
+            for p in queries.list_products(category="Security")
+            if "smart" in p.name.lower() or "smart" in p.category.lower()
+        ]
+        assert expected
+
+        products = queries.list_products(category="Security", search="smart")
+        assert {p.product_id for p in products} == {p.product_id for p in expected}
+
+    def test_list_products_page_uses_index_order(self, mock_db_path):
+        """Test product pages are read in index order, without a sort step."""
+        for plan in _query_plans(
+            lambda: queries.list_products(category="Laptop", limit=100, after_id=50)
+        ):
+            assert "TEMP B-TREE" not in plan
+
+    def test_list_products_keyset_pagination(self, mock_db_path):
+        """Test paging through products with limit and after_id."""
+        all_ids = sorted(p.product_id for p in queries.list_products())
+
+        first_page = queries.list_products(limit=3)
+        assert [p.product_id for p in first_page] == all_ids[:3]
+
+        second_page = queries.list_products(limit=3, after_id=first_page[-1].product_id)
+        assert [p.product_id for p in second_page] == all_ids[3:6]
+
     def test_list_product_categories(self, mock_db_path):
         """Test listing all product categories."""
         categories = queries.list_product_categories()
@@ -455,6 +555,15 @@ class TestOrderQueries:
         assert retrieved.order_id == order_id
         assert retrieved.items is not None
 
+    def test_get_order_by_id_without_items(self, mock_db_path):
+        """Test getting an order without loading its items."""
+        order_id = queries.list_orders()[0].order_id
+
+        retrieved = queries.get_order_by_id(order_id, with_items=False)
+        assert retrieved.order_id == order_id
+        assert retrieved.status == queries.get_order_by_id(order_id).status
+        assert retrieved.items == []
+
     def test_get_order_by_id_nonexistent(self, mock_db_path):
         """Test getting non-existent order."""
         order = queries.get_order_by_id(99999)
@@ -490,6 +599,57 @@ class TestOrderQueries:
         orders = queries.list_orders(search="Mohammad")
         assert len(orders) >= 1
 
+    def test_list_orders_item_count(self, mock_db_path):
+        """Test listed orders carry their item count."""
+        for order in queries.list_orders():
+            detail = queries.get_order_by_id(order.order_id)
+            assert order.item_count == len(detail.items)
+
+    def test_list_orders_single_query(self, mock_db_path):
+        """Test customer names and item counts come from one statement."""
+        assert _count_selects(queries.list_orders) == 1
+
+    def test_list_order_rows(self, mock_db_path):
+        """Test lightweight order rows match the validated listing."""
+        orders = queries.list_orders(limit=100)
+        rows = queries.list_order_rows(limit=100)
+
+        assert [r.order_id for r in rows] == [o.order_id for o in orders]
+        for row, order in zip(rows, orders):
+            assert row.order_date == order.order_date.strftime("%Y-%m-%d %H:%M")
+            assert row.total == f"${order.total_price:.2f}"
+            assert row.item_count == order.item_count
+            assert row.customer_name == order.customer_name
+            assert row.status == order.status
+
+    def test_list_order_rows_share_status_strings(self, mock_db_path):
+        """Test rows with the same status reuse one interned string."""
+        rows = queries.list_order_rows(limit=100)
+
+        assert rows
+        assert all(row.status is sys.intern(row.status) for row in rows)
+
+    def test_list_orders_page_uses_index_order(self, mock_db_path):
+        """Test order pages are read in index order, without a sort step."""
+        customer_id = queries.list_customers()[0].user_id
+        for filters in ({}, {"status": "Pending"}, {"user_id": customer_id}):
+            for plan in _query_plans(
+                lambda filters=filters: queries.list_order_rows(
+                    limit=100, after_id=50, **filters
+                )
+            ):
+                assert "TEMP B-TREE" not in plan
+
+    def test_list_orders_keyset_pagination(self, mock_db_path):
+        """Test paging through orders newest ID first with limit and after_id."""
+        all_ids = sorted((o.order_id for o in queries.list_orders()), reverse=True)
+
+        first_page = queries.list_orders(limit=2)
+        assert [o.order_id for o in first_page] == all_ids[:2]
+
+        second_page = queries.list_orders(limit=2, after_id=first_page[-1].order_id)
+        assert [o.order_id for o in second_page] == all_ids[2:4]
+
     def test_update_order_status(self, mock_db_path):
         """Test updating order status."""
         # Get a pending order
@@ -503,6 +663,17 @@ class TestOrderQueries:
         assert updated is not None
         assert updated.status == "Completed"
 
+    def test_update_order_status_from_statuses(self, mock_db_path):
+        """Test a guarded status update skips orders in other statuses."""
+        order_id = queries.list_orders(status="Completed")[0].order_id
+        update = OrderUpdateStatus(status="Cancelled")
+
+        assert queries.update_order_status(order_id, update, ("Pending",)) is None
+        assert queries.get_order_by_id(order_id).status == "Completed"
+
+        updated = queries.update_order_status(order_id, update, ("Completed",))
+        assert updated.status == "Cancelled"
+
     def test_update_order_status_nonexistent(self, mock_db_path):
         """Test updating status of non-existent order."""
         update = OrderUpdateStatus(status="Completed")
@@ -584,6 +755,15 @@ class TestServiceRequestQueries:
         # Should have seed data requests
         assert len(requests) >= 4
 
+    def test_list_service_requests_newest_first_by_date(self, mock_db_path):
+        """Test unpaged listings are ordered by request date, not ID."""
+        requests = queries.list_service_requests()
+        dates = [r.request_date for r in requests]
+
+        assert dates == sorted(dates, reverse=True)
+        # Seed request 4 has the highest ID but the oldest date.
+        assert requests[-1].request_id == 4
+
     def test_list_service_requests_filter_by_status(self, mock_db_path):
         """Test listing service requests filtered by status."""
         pending = queries.list_service_requests(status="Pending")
@@ -624,6 +804,68 @@ class TestServiceRequestQueries:
         for req in requests:
             assert "Installation" in req.service_type
 
+    def test_list_service_requests_page_uses_index_order(self, mock_db_path):
+        """Test request pages are read in index order, without a sort step."""
+        customer_id = queries.list_customers()[0].user_id
+        specialist_id = queries.list_specialists()[0].user_id
+        for filters in (
+            {},
+            {"status": "Pending"},
+            {"customer_id": customer_id},
+            {"available_to_specialist": specialist_id},
+        ):
+            for plan in _query_plans(
+                lambda filters=filters: queries.list_service_request_rows(
+                    limit=100, after_id=50, **filters
+                )
+            ):
+                assert "TEMP B-TREE" not in plan
+
+    def test_list_service_requests_keyset_pagination(self, mock_db_path):
+        """Test paging service requests newest ID first with limit and after_id."""
+        all_ids = sorted(
+            (r.request_id for r in queries.list_service_requests()), reverse=True
+        )
+
+        first_page = queries.list_service_requests(limit=2)
+        assert [r.request_id for r in first_page] == all_ids[:2]
+
+        second_page = queries.list_service_requests(
+            limit=2, after_id=first_page[-1].request_id
+        )
+        assert [r.request_id for r in second_page] == all_ids[2:4]
+
+    def test_list_service_request_rows(self, mock_db_path):
+        """Test lightweight rows match the validated listing."""
+        requests = queries.list_service_requests()
+        rows = queries.list_service_request_rows()
+
+        assert [r.request_id for r in rows] == [r.request_id for r in requests]
+        assert rows[0].customer_name == requests[0].customer_name
+        assert rows[0].request_date == requests[0].request_date.strftime(
+            "%Y-%m-%d %H:%M"
+        )
+        for row, request in zip(rows, requests):
+            assert row.service_type == request.service_type
+            assert row.status == request.status
+            assert row.specialist_name == request.specialist_name
+
+    def test_list_service_request_rows_share_status_strings(self, mock_db_path):
+        """Test rows with the same status reuse one interned string."""
+        rows = queries.list_service_request_rows()
+
+        assert rows
+        assert all(row.status is sys.intern(row.status) for row in rows)
+
+    def test_list_service_request_rows_available_to_specialist(self, mock_db_path):
+        """Test rows for a specialist include unassigned and their own requests."""
+        specialist_id = queries.list_specialists()[0].user_id
+        expected = queries.list_service_requests_for_specialist(specialist_id)
+
+        rows = queries.list_service_request_rows(available_to_specialist=specialist_id)
+
+        assert {r.request_id for r in rows} == {r.request_id for r in expected}
+
     def test_update_service_request_status(self, mock_db_path):
         """Test updating service request status."""
         # Get a pending request
@@ -708,3 +950,35 @@ class TestServiceRequestQueries:
         # Should include unassigned and assigned to this specialist
         for req in requests:
             assert req.specialist_id is None or req.specialist_id == specialist_id
+
+    def test_list_service_requests_for_specialist_filtered(self, mock_db_path):
+        """Test status and search filtering for specialist listings."""
+        specialist_id = queries.list_specialists()[0].user_id
+        requests = queries.list_service_requests_for_specialist(specialist_id)
+
+        pending = queries.list_service_requests_for_specialist(
+            specialist_id, status="Pending"
+        )
+        assert pending == [r for r in requests if r.status == "Pending"]
+
+        service_type = requests[0].service_type
+        matching = queries.list_service_requests_for_specialist(
+            specialist_id, search=service_type
+        )
+        assert requests[0] in matching
+        assert all(
+            service_type in r.service_type or service_type in r.customer_name
+            for r in matching
+        )
+
+    def test_list_service_requests_single_query(self, mock_db_path):
+        """Test customer and specialist names are joined, not looked up."""
+        specialist_id = queries.list_specialists()[0].user_id
+
+        assert _count_selects(queries.list_service_requests) == 1
+        assert (
+            _count_selects(
+                lambda: queries.list_service_requests_for_specialist(specialist_id)
+            )
+            == 1
+        )
@@ -0,0 +1,58 @@
+"""Test order details screen."""
+
+from textual.widgets import DataTable, Label
+
+from tui.screens.order_view import OrderViewScreen
+
+
+class TestOrderViewScreen:
+    """Test order details screen."""
+
+    async def test_shows_order_and_items(self, app, mock_db_path, mock_admin_user):
+        """Test the order's details and items are shown."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen(OrderViewScreen(1))
+            await pilot.pause()
+
+            screen = app.screen
+            assert screen.order is not None
+            assert str(screen.query_one("#order-status", Label).render()) == "Pending"
+            assert str(screen.query_one("#order-total", Label).render()) == "$489.98"
+            assert screen.query_one("#order-items-table", DataTable).row_count == 2
+
+    async def test_customer_sees_own_order(self, app, mock_db_path, mock_customer_user):
+        """Test customers can view orders they placed."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_customer_user
+
+            app.push_screen(OrderViewScreen(1))
+            await pilot.pause()
+
+            assert app.screen.order is not None
+            assert app.screen.query_one("#order-missing", Label).display is False
+
+    async def test_customer_cannot_see_other_orders(
+        self, app, mock_db_path, mock_customer_user
+    ):
+        """Test customers get "not found" for another customer's order."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_customer_user
+
+            app.push_screen(OrderViewScreen(2))
+            await pilot.pause()
+
+            assert app.screen.order is None
+            assert app.screen.query_one("#order-missing", Label).display is True
+
+    async def test_missing_order(self, app, mock_db_path, mock_admin_user):
+        """Test an unknown order ID shows "not found"."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen(OrderViewScreen(9999))
+            await pilot.pause()
+
+            assert app.screen.order is None
+            assert app.screen.query_one("#order-missing", Label).display is True
@@ -1,8 +1,36 @@
 """Test profile screen functionality."""
 
-from textual.widgets import DataTable, TabbedContent
+from textual.widgets import DataTable, Select, TabbedContent
+
+from database.queries import create_user, get_user_by_email, update_user
+from models import UserCreate, UserUpdate
 
 from tui.screens.profile import ProfileScreen
+from tui.screens.user_edit import UserEditScreen
+
+
+def _create_users(count: int) -> list[int]:
+    """Create ``count`` customers and return their IDs."""
+    return [
+        create_user(
+            UserCreate(
+                name=f"Bulk User {i}",
+                email=f"bulk{i}@example.com",
+                phone="0912000",
+                role="Customer",
+                password="secret1",
+            ),
+            "not-a-real-hash",
+        ).user_id
+        for i in range(count)
+    ]
+
+
+async def _settle(app, pilot) -> None:
+    """Let pending table loads finish and their rows render."""
+    await pilot.pause()
+    await app.workers.wait_for_complete()
+    await pilot.pause()
 
 
 class TestProfileScreen:
@@ -109,3 +137,141 @@ class TestProfileScreen:
 
             tabbed_content = list(app.screen.query(TabbedContent))
             assert len(tabbed_content) == 0
+
+    async def test_profile_screen_admin_edit_user(self, app, mock_admin_user):
+        """Test that editing the selected user opens the edit screen for it."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen("profile")
+            await pilot.pause()
+
+            app.screen.selected_user_id = mock_admin_user.user_id
+            app.screen.action_edit_user()
+            await pilot.pause()
+
+            assert isinstance(app.screen, UserEditScreen)
+            assert app.screen.user_id == mock_admin_user.user_id
+            assert app.screen.user is not None
+
+    async def test_profile_screen_admin_import_users(
+        self, app, mock_db_path, mock_admin_user, tmp_path
+    ):
+        """Test importing a CSV from the users tab adds the users to the table."""
+        path = tmp_path / "users.csv"
+        path.write_text(
+            "name,email,phone,role,password\n"
+            "Sara Karimi,sara@example.com,0912111,Customer,secret1\n"
+        )
+        app.bcrypt_rounds = 4
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen("profile")
+            await pilot.pause()
+
+            screen = app.screen
+            table = screen.query_one("#users-table", DataTable)
+            row_count = table.row_count
+
+            await screen._import_users(str(path))
+            await pilot.pause()
+
+            user = get_user_by_email("sara@example.com")
+            assert user.password_hash.startswith("$2b$04$")
+            assert table.row_count == row_count + 1
+            assert str(user.user_id) in table.rows
+
+    async def test_profile_screen_users_next_page(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test the users table loads a page and appends the next at its end."""
+        _create_users(150)
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen("profile")
+            await _settle(app, pilot)
+
+            table = app.screen.query_one("#users-table", DataTable)
+            assert table.row_count == 100
+            first_page = table.ordered_rows[0]
+
+            table.move_cursor(row=table.row_count - 1)
+            await _settle(app, pilot)
+
+            assert table.row_count == 156
+            assert table.ordered_rows[0] is first_page
+            ids = [int(row.key.value) for row in table.ordered_rows]
+            assert ids == sorted(set(ids))
+
+    async def test_profile_screen_users_reconcile(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test reloads only replace rows that changed and keep ID order."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen("profile")
+            await _settle(app, pilot)
+
+            table = app.screen.query_one("#users-table", DataTable)
+            untouched = table.rows["3"]
+            update_user(2, UserUpdate(name="Ali Renamed"))
+
+            app.screen.action_refresh()
+            await _settle(app, pilot)
+
+            assert table.row_count == 6
+            assert table.rows["3"] is untouched
+            assert table.get_row("2")[1] == "Ali Renamed"
+            ids = [row.key.value for row in table.ordered_rows]
+            assert ids == [str(user_id) for user_id in range(1, 7)]
+
+            app.screen.query_one("#role-filter", Select).value = "Customer"
+            await _settle(app, pilot)
+
+            assert [row.key.value for row in table.ordered_rows] == ["4", "5", "6"]
+
+    async def test_profile_screen_delete_user_in_place(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test deleting a user removes just its row without a reload."""
+        [user_id] = _create_users(1)
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen("profile")
+            await _settle(app, pilot)
+
+            screen = app.screen
+            table = screen.query_one("#users-table", DataTable)
+            rows = {key: row for key, row in table.rows.items() if key != str(user_id)}
+
+            screen.selected_user_id = user_id
+            screen.action_delete_user()
+            await pilot.pause()
+
+            assert screen.selected_user_id is None
+            assert user_id not in screen._users.records
+            assert table.rows == rows
+
+    async def test_profile_screen_admin_import_bad_file(
+        self, app, mock_db_path, mock_admin_user, tmp_path
+    ):
+        """Test a file that is not UTF-8 reports an error instead of exiting."""
+        path = tmp_path / "users.csv"
+        path.write_bytes(b"name,email\n\xff\xfe\xfa\n")
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen("profile")
+            await pilot.pause()
+
+            screen = app.screen
+            screen._on_import_path(str(path))
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert app.is_running
+            assert app.screen is screen
@@ -1,7 +1,14 @@
 """Test signup screen functionality."""
 
+import bcrypt
 from textual.widgets import Input
 
+from database.queries import get_user_by_email
+from tui.screens._signup_common import (
+    _hash_many,
+    _import_users_csv,
+    _validate_signup,
+)
 from tui.screens.login import LoginScreen
 from tui.screens.signup import SignupScreen
 
@@ -36,3 +43,114 @@ class TestSignupScreen:
             await pilot.pause()
 
             assert isinstance(app.screen, LoginScreen)
+
+
+class TestValidateSignup:
+    """Test shared signup form validation."""
+
+    def test_valid_fields(self):
+        """Test valid fields produce no error."""
+        assert _validate_signup("Ali", "a@b.com", "0912", "secret1", "secret1") is None
+
+    def test_missing_field(self):
+        """Test a missing field is reported."""
+        error = _validate_signup("", "a@b.com", "0912", "secret1", "secret1")
+        assert error == "Please fill in all required fields"
+
+    def test_invalid_email(self):
+        """Test a malformed email is reported."""
+        error = _validate_signup("Ali", "a@b", "0912", "secret1", "secret1")
+        assert error == "Invalid email address"
+
+    def test_password_mismatch(self):
+        """Test mismatched passwords are reported."""
+        error = _validate_signup("Ali", "a@b.com", "0912", "secret1", "secret2")
+        assert error == "Passwords do not match"
+
+    def test_short_password(self):
+        """Test passwords under six characters are reported."""
+        error = _validate_signup("Ali", "a@b.com", "0912", "abc", "abc")
+        assert error == "Password must be at least 6 characters"
+
+    def test_without_confirm(self):
+        """Test forms without a confirmation field skip the match check only."""
+        assert _validate_signup("Ali", "a@b.com", "0912", "secret1") is None
+        error = _validate_signup("Ali", "a@b.com", "0912", "abc")
+        assert error == "Password must be at least 6 characters"
+
+
+def test_hash_many():
+    """Test bulk hashing keeps order and produces verifiable hashes."""
+    hashes = _hash_many(["secret1", "secret2"])
+    assert bcrypt.checkpw(b"secret1", hashes[0].encode())
+    assert bcrypt.checkpw(b"secret2", hashes[1].encode())
+
+
+class TestImportUsersCsv:
+    """Test bulk user import from CSV."""
+
+    HEADER = "name,email,phone,role,password\n"
+
+    def _write(self, tmp_path, rows):
+        path = tmp_path / "users.csv"
+        path.write_text(self.HEADER + "".join(row + "\n" for row in rows))
+        return str(path)
+
+    def test_creates_valid_rows(self, mock_db_path, tmp_path):
+        """Test valid rows become users with hashes at the requested cost."""
+        path = self._write(
+            tmp_path,
+            [
+                "Sara Karimi,sara@example.com,0912111,Specialist,secret1",
+                "Reza Moradi,reza@example.com,0912222,,secret2",
+            ],
+        )
+
+        assert _import_users_csv(path, rounds=4) == (2, 0)
+
+        sara = get_user_by_email("sara@example.com")
+        assert sara.role == "Specialist"
+        assert sara.password_hash.startswith("$2b$04$")
+        assert bcrypt.checkpw(b"secret1", sara.password_hash.encode())
+        assert get_user_by_email("reza@example.com").role == "Customer"
+
+    def test_skips_invalid_rows(self, mock_db_path, tmp_path):
+        """Test rows failing validation are skipped and counted."""
+        path = self._write(
+            tmp_path,
+            [
+                "Bad Email,not-an-email,0912111,Customer,secret1",
+                "Short Pass,short@example.com,0912222,Customer,abc",
+                "Bad Role,role@example.com,0912333,Owner,secret1",
+                ",noname@example.com,0912444,Customer,secret1",
+                f"{'N' * 300},longname@example.com,0912666,Customer,secret1",
+                f"Long Phone,longphone@example.com,{'0' * 60},Customer,secret1",
+                "Good User,good@example.com,0912555,Customer,secret1",
+            ],
+        )
+
+        assert _import_users_csv(path, rounds=4) == (1, 6)
+        assert get_user_by_email("good@example.com") is not None
+        for email in (
+            "short@example.com",
+            "role@example.com",
+            "noname@example.com",
+            "longname@example.com",
+            "longphone@example.com",
+        ):
+            assert get_user_by_email(email) is None
+
+    def test_skips_duplicate_emails(self, mock_db_path, tmp_path):
+        """Test existing and repeated emails are skipped, not fatal."""
+        path = self._write(
+            tmp_path,
+            [
+                "Ali Again,ali.ahmadi@ctrlmarket.com,0912111,Customer,secret1",
+                "New User,new@example.com,0912222,Customer,secret1",
+                "New Twin,new@example.com,0912333,Customer,secret2",
+            ],
+        )
+
+        assert _import_users_csv(path, rounds=4) == (1, 2)
+        assert get_user_by_email("ali.ahmadi@ctrlmarket.com").name == "Ali Ahmadi"
+        assert get_user_by_email("new@example.com").name == "New User"
@@ -0,0 +1,83 @@
+"""Test user edit screen."""
+
+from textual.widgets import Input, Select
+
+from database.queries import get_user_by_id
+from tui.screens.user_edit import UserEditScreen
+
+
+class TestUserEditScreen:
+    """Test user edit screen."""
+
+    async def test_form_loads_user(self, app, mock_db_path, mock_admin_user):
+        """Test the form is filled in from the user being edited."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen(UserEditScreen(2))
+            await pilot.pause()
+
+            screen = app.screen
+            assert screen.query_one("#email", Input).value == (
+                "ali.ahmadi@ctrlmarket.com"
+            )
+            assert screen.query_one("#role", Select).value == "Specialist"
+
+    async def test_save_updates_user(self, app, mock_db_path, mock_admin_user):
+        """Test saving writes the changed fields and closes the screen."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen(UserEditScreen(2))
+            await pilot.pause()
+
+            screen = app.screen
+            screen.query_one("#phone", Input).value = "09120000000"
+            screen.query_one("#role", Select).value = "Admin"
+            screen.action_save_user()
+            await pilot.pause()
+
+            assert not isinstance(app.screen, UserEditScreen)
+            user = get_user_by_id(2)
+            assert user.phone == "09120000000"
+            assert user.role == "Admin"
+            assert user.name == "Ali Ahmadi"
+
+    async def test_save_rejects_invalid_fields(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test empty fields and malformed emails are not saved."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+
+            app.push_screen(UserEditScreen(2))
+            await pilot.pause()
+
+            screen = app.screen
+            screen.query_one("#name", Input).value = ""
+            screen.action_save_user()
+            await pilot.pause()
+            assert app.screen is screen
+
+            screen.query_one("#name", Input).value = "Ali"
+            screen.query_one("#email", Input).value = "not-an-email"
+            screen.action_save_user()
+            await pilot.pause()
+            assert app.screen is screen
+
+            assert get_user_by_id(2).name == "Ali Ahmadi"
+
+    async def test_non_admin_cannot_edit(self, app, mock_db_path, mock_specialist_user):
+        """Test non-admins see the access denied message and cannot save."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_specialist_user
+
+            app.push_screen(UserEditScreen(4))
+            await pilot.pause()
+
+            screen = app.screen
+            screen.action_save_user()
+            await pilot.pause()
+
+            assert screen.user is None
+            assert app.screen is screen
@@ -1,10 +1,26 @@
 """Test workspace screen functionality."""
 
-from textual.widgets import Input, Select
+from textual.widgets import DataTable, Input, Select
 
+from database.queries import (
+    create_product,
+    get_order_by_id,
+    get_service_request_by_id,
+    list_products,
+    update_order_status,
+    update_service_request_status,
+)
+from models import OrderUpdateStatus, ProductCreate, ServiceRequestUpdateStatus
 from tui.screens.workspace import WorkspaceScreen
 
 
+async def _settle(app, pilot) -> None:
+    """Let pending table loads finish and their rows render."""
+    await pilot.pause()
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
 class TestWorkspaceScreen:
     """Test workspace screen functionality."""
 
@@ -86,3 +102,206 @@ class TestWorkspaceScreen:
 
             search_input = app.screen.query_one("#services-search", Input)
             assert search_input.display
+
+    async def test_tabs_load_on_first_visit(self, app, mock_admin_user):
+        """Test only the initial tab is loaded on mount; others load when shown."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            app.push_screen("workspace")
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+
+            orders_table = app.screen.query_one("#orders-table", DataTable)
+            assert orders_table.row_count == 0
+
+            app.screen.action_switch_tab("orders")
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert orders_table.row_count > 0
+
+    async def test_resume_reloads_expired_categories(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test expired categories are re-queried on a worker when resuming."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            app.push_screen("workspace")
+            await _settle(app, pilot)
+
+            workspace = app.screen
+            create_product(ProductCreate(name="Drone", category="Aerial", price=10))
+            stamp, _, categories = app.cached_categories
+            app.cached_categories = (stamp, 0.0, categories)
+
+            workspace.on_screen_resume()
+            assert "Aerial" not in workspace.categories
+            await _settle(app, pilot)
+
+            assert "Aerial" in workspace.categories
+
+    async def test_product_search_with_untouched_category(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test typing a search leaves an untouched category unfiltered."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            app.push_screen("workspace")
+            await _settle(app, pilot)
+
+            workspace = app.screen
+            assert workspace.query_one("#products-category", Select).is_blank()
+
+            workspace.query_one("#products-search", Input).focus()
+            await pilot.press(*"Smart")
+            await pilot.pause(0.5)
+            await _settle(app, pilot)
+
+            table = workspace.query_one("#products-table", DataTable)
+            expected = [str(p.product_id) for p in list_products(search="Smart")]
+            assert 0 < len(expected) < len(list_products())
+            assert sorted(key.value for key in table.rows) == sorted(expected)
+
+    async def test_search_reloads_once_for_a_burst(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test a newer search supersedes a pending one and repeats are skipped."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            app.push_screen("workspace")
+            await _settle(app, pilot)
+
+            workspace = app.screen
+            pages = workspace._pages["products"]
+            fetch = pages._fetch
+            searches = []
+            pages._fetch = lambda **filters: (
+                searches.append(filters.get("search")) or fetch(**filters)
+            )
+
+            search_input = workspace.query_one("#products-search", Input)
+            search_input.value = "Security"
+            search_input.value = "Smart"
+            await pilot.pause(0.5)
+            await _settle(app, pilot)
+
+            assert searches == ["Smart"]
+
+            workspace._search_from_input(search_input)
+            await pilot.pause(0.5)
+            await _settle(app, pilot)
+
+            assert searches == ["Smart"]
+
+    async def test_products_load_next_page(self, app, mock_db_path, mock_admin_user):
+        """Test the next page is appended when the cursor reaches the last row."""
+        for i in range(150):
+            create_product(ProductCreate(name=f"Bulk {i}", category="Bulk", price=1))
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            app.push_screen("workspace")
+            await _settle(app, pilot)
+
+            table = app.screen.query_one("#products-table", DataTable)
+            assert table.row_count == 100
+
+            table.move_cursor(row=table.row_count - 1)
+            await _settle(app, pilot)
+
+            assert table.row_count == 158
+
+    async def test_cancel_order_reloads_table(self, app, mock_db_path, mock_admin_user):
+        """Test cancelling a pending order updates it and reloads the table."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            workspace = WorkspaceScreen("orders")
+            app.push_screen(workspace)
+            await _settle(app, pilot)
+
+            workspace.selected_order_id = 1
+            workspace.action_cancel_item()
+            await _settle(app, pilot)
+
+            table = workspace.query_one("#orders-table", DataTable)
+            assert get_order_by_id(1).status == "Cancelled"
+            assert table.get_row("1")[5] == "Cancelled"
+
+    async def test_complete_order_reloads_table(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test completing a pending order updates it and reloads the table."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            workspace = WorkspaceScreen("orders")
+            app.push_screen(workspace)
+            await _settle(app, pilot)
+
+            workspace.selected_order_id = 1
+            workspace.action_complete_item()
+            await _settle(app, pilot)
+
+            table = workspace.query_one("#orders-table", DataTable)
+            assert get_order_by_id(1).status == "Completed"
+            assert table.get_row("1")[5] == "Completed"
+
+    async def test_stale_completed_order_is_not_cancelled(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test a row still shown as Pending cannot cancel a completed order."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            workspace = WorkspaceScreen("orders")
+            app.push_screen(workspace)
+            await _settle(app, pilot)
+
+            update_order_status(1, OrderUpdateStatus(status="Completed"))
+            table = workspace.query_one("#orders-table", DataTable)
+            assert table.get_row("1")[5] == "Pending"
+
+            workspace.selected_order_id = 1
+            workspace.action_cancel_item()
+            await _settle(app, pilot)
+
+            assert get_order_by_id(1).status == "Completed"
+
+    async def test_complete_service_request_reloads_table(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test completing a request updates it and reloads the table."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            workspace = WorkspaceScreen("services")
+            app.push_screen(workspace)
+            await _settle(app, pilot)
+
+            workspace.selected_request_id = 2
+            workspace.action_complete_item()
+            await _settle(app, pilot)
+
+            table = workspace.query_one("#services-table", DataTable)
+            assert get_service_request_by_id(2).status == "Completed"
+            assert table.get_row("2")[3] == "Completed"
+
+    async def test_stale_completed_request_is_not_cancelled(
+        self, app, mock_db_path, mock_admin_user
+    ):
+        """Test a stale Pending row cannot cancel a completed request."""
+        async with app.run_test() as pilot:
+            app.current_user = mock_admin_user
+            workspace = WorkspaceScreen("services")
+            app.push_screen(workspace)
+            await _settle(app, pilot)
+
+            update_service_request_status(
+                1, ServiceRequestUpdateStatus(status="Completed")
+            )
+            table = workspace.query_one("#services-table", DataTable)
+            assert table.get_row("1")[3] == "Pending"
+
+            workspace.selected_request_id = 1
+            workspace.action_cancel_item()
+            await _settle(app, pilot)
+
+            assert get_service_request_by_id(1).status == "Completed"
+            assert table.get_row("1")[3] == "Completed"
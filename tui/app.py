@@ -36,6 +36,11 @@ class CtrlMarketApp(App):
 
     def __init__(self) -> None:
         self.current_user: SessionUser | None = None
+        self.bcrypt_rounds: int = 12
+        # Bumped whenever products change; cached_categories holds the
+        # (stamp, expiry, categories) triple it was built for.
+        self.categories_stamp: int = 0
+        self.cached_categories: tuple[int, float, list[str]] | None = None
         super().__init__()
 
     def on_mount(self) -> None:
@@ -4,13 +4,17 @@ from textual.app import ComposeResult
 from textual.containers import Container
 from textual.reactive import reactive
 from textual.screen import ModalScreen
-from textual.widgets import Button, Label, Static
+from textual.widgets import Button, Input, Label, Static
 
 
 class ShortcutsBar(Static):
-    """Bar at bottom showing keyboard shortcuts for current context."""
+    """Bar at bottom showing keyboard shortcuts for current context.
 
-    shortcuts = reactive("")
+    Assigning an equal string is a no-op, and ``update`` does the refresh
+    itself, so the reactive does not repaint as well.
+    """
+
+    shortcuts = reactive("", repaint=False)
 
     def watch_shortcuts(self, shortcuts: str) -> None:
         """Update display when shortcuts change."""
@@ -51,3 +55,36 @@ class ConfirmDialog(ModalScreen[bool]):
         elif event.key == "n":
             no_btn = self.query_one("#btn-no", Button)
             self.on_button_pressed(Button.Pressed(no_btn))
+
+
+class InputDialog(ModalScreen[str | None]):
+    """Dialog asking for a single line of text; dismisses with it or None."""
+
+    def __init__(self, title: str, placeholder: str = "") -> None:
+        self.dialog_title = title
+        self.placeholder = placeholder
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        with Container(classes="dialog-container"):
+            yield Label(self.dialog_title, classes="dialog-title")
+            yield Input(placeholder=self.placeholder, id="dialog-input")
+            with Container(classes="dialog-buttons"):
+                yield Button("OK", id="btn-ok", variant="primary")
+                yield Button("Cancel", id="btn-cancel")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle button press."""
+        if event.button.id == "btn-ok":
+            self.dismiss(self.query_one("#dialog-input", Input).value.strip() or None)
+        elif event.button.id == "btn-cancel":
+            self.dismiss(None)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Accept the value on Enter."""
+        self.dismiss(event.value.strip() or None)
+
+    def on_key(self, event) -> None:
+        """Handle key press."""
+        if event.key == "escape":
+            self.dismiss(None)
@@ -0,0 +1,138 @@
+"""Shared validation and hashing for the signup, new user and user import forms."""
+
+import asyncio
+import csv
+import os
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from pydantic import ValidationError
+
+from database.queries import create_user
+from models import UserCreate
+from tui.dialogs import InputDialog
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+_ROLE_OPTIONS = (
+    ("Customer", "Customer"),
+    ("Specialist", "Specialist"),
+    ("Admin", "Admin"),
+)
+
+
+def _validate_signup(
+    name: str, email: str, phone: str, password: str, confirm: str | None = None
+) -> str | None:
+    """Validate pre-stripped signup fields and return an error message, if any.
+
+    Forms without a confirmation field (users created by an admin) pass no
+    ``confirm``; the password minimum is UserCreate's and always applies.
+    """
+    if not (name and email and phone and password):
+        return "Please fill in all required fields"
+    if not _EMAIL_RE.fullmatch(email):
+        return "Invalid email address"
+    if confirm is not None and password != confirm:
+        return "Passwords do not match"
+    if len(password) < 6:
+        return "Password must be at least 6 characters"
+    return None
+
+
+def _hash_password(password: str, salt: bytes | None = None) -> str:
+    """Hash a password with bcrypt (slow; call it off the event loop)."""
+    return bcrypt.hashpw(password.encode(), salt or bcrypt.gensalt()).decode()
+
+
+def _hash_many(passwords: list[str], rounds: int = 12) -> list[str]:
+    """Hash several passwords in parallel; bcrypt releases the GIL while hashing."""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(
+            executor.map(
+                lambda password: _hash_password(password, bcrypt.gensalt(rounds)),
+                passwords,
+            )
+        )
+
+
+def _import_users_csv(path: str, rounds: int = 12) -> tuple[int, int]:
+    """Create users from a CSV file and return (created, skipped) counts.
+
+    The file needs a header row with name, email, phone, role and password
+    columns. Rows failing the signup checks or UserCreate's field limits,
+    and duplicate emails, are skipped. Passwords are
+    hashed in parallel with ``rounds`` since bcrypt dominates the cost of the
+    import.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    users = []
+    for row in rows:
+        name, email, phone, role, password = (
+            (row.get(field) or "").strip()
+            for field in ("name", "email", "phone", "role", "password")
+        )
+        if _validate_signup(name, email, phone, password):
+            continue
+        try:
+            users.append(
+                UserCreate(
+                    name=name,
+                    email=email,
+                    phone=phone,
+                    role=role or "Customer",
+                    password=password,
+                )
+            )
+        except ValidationError:
+            continue
+
+    created = 0
+    for user, password_hash in zip(
+        users, _hash_many([user.password for user in users], rounds), strict=True
+    ):
+        try:
+            create_user(user, password_hash)
+        except sqlite3.IntegrityError:
+            continue
+        created += 1
+    return created, len(rows) - created
+
+
+class _UserImportMixin:
+    """CSV user import for admin screens that list users in ``self._users``."""
+
+    def action_import_users(self) -> None:
+        """Ask for a CSV file and bulk-create the users in it."""
+        current_user = getattr(self.app, "current_user", None)
+        if not current_user or current_user.role != "Admin":
+            return
+
+        self.app.push_screen(
+            InputDialog("Import users from CSV", placeholder="Path to CSV file"),
+            self._on_import_path,
+        )
+
+    def _on_import_path(self, path: str | None) -> None:
+        """Start the import once a path has been entered."""
+        if path:
+            self.notify("Importing users...")
+            self.run_worker(self._import_users(path), group="import")
+
+    async def _import_users(self, path: str) -> None:
+        """Run the CSV import on a worker thread and refresh the table."""
+        try:
+            created, skipped = await asyncio.to_thread(
+                _import_users_csv, path, getattr(self.app, "bcrypt_rounds", 12)
+            )
+        except (OSError, ValueError, csv.Error) as e:
+            # ValueError covers files that are not valid UTF-8.
+            self.notify(f"Import failed: {e}", severity="error")
+            return
+
+        self.notify(f"Imported {created} users ({skipped} skipped)")
+        await self._users.load(**self._users.filters)
@@ -0,0 +1,141 @@
+"""Shared pieces of the listing screens and their ID-keyed data tables."""
+
+import asyncio
+from typing import Any, Callable, Iterable
+
+from textual.widgets import DataTable
+from textual.widgets.data_table import RowKey
+
+_SIDEBAR_DIVIDER = "─" * 18
+_PAGE_SIZE = 100
+
+
+def _add_keyed_rows(table: DataTable, rows) -> None:
+    """Append rows keyed by their ID cell, so selection needs no row lookup."""
+    for row in rows:
+        table.add_row(*row, key=row[0])
+
+
+def _row_key_id(row_key: RowKey) -> int | None:
+    """Get the record ID stored in a row key."""
+    return int(row_key.value) if row_key.value is not None else None
+
+
+class _PagedTable:
+    """Keyset-paged records shown in a DataTable, one row per record ID.
+
+    ``fetch(after_id=None, **filters)`` returns one page of at most
+    ``_PAGE_SIZE`` records and runs on a worker thread; ``row`` formats a
+    record as table cells, its ID first. Every ``load`` takes a new query
+    token, so a page that arrives after a newer load started is dropped.
+
+    With ``reconcile`` a load only touches rows that changed instead of
+    rebuilding the table; the table must then be ordered by ascending ID and
+    have its ID column keyed ``"id"``.
+    """
+
+    def __init__(
+        self,
+        table: DataTable,
+        fetch: Callable[..., list],
+        row: Callable[[Any], Iterable[str]],
+        id_attr: str,
+        reconcile: bool = False,
+    ) -> None:
+        self.table = table
+        self.records: dict[int, Any] = {}
+        self.filters: dict[str, Any] = {}
+        self._fetch = fetch
+        self._row = row
+        self._id_attr = id_attr
+        self._reconcile = reconcile
+        self._token = 0
+        self._last_id: int | None = None
+        self._has_more = False
+        self._loading_page = False
+
+    async def load(self, **filters: Any) -> bool:
+        """Show the first page for ``filters``; False if it went stale."""
+        self._token += 1
+        token = self._token
+        page = await asyncio.to_thread(self._fetch, **filters)
+        if token != self._token:
+            return False
+
+        self.filters = filters
+        with self.table.app.batch_update():
+            if self._reconcile:
+                self._reconcile_page(page)
+            else:
+                self.table.clear()
+                self.records.clear()
+                self._add_page(page)
+        return True
+
+    def wants_more(self, cursor_row: int) -> bool:
+        """Claim the next page load once the cursor reaches the last row."""
+        if (
+            self._has_more
+            and not self._loading_page
+            and cursor_row >= self.table.row_count - 1
+        ):
+            self._loading_page = True
+            return True
+        return False
+
+    async def load_more(self) -> None:
+        """Append the next page for the current filters."""
+        token = self._token
+        try:
+            page = await asyncio.to_thread(
+                self._fetch, after_id=self._last_id, **self.filters
+            )
+        finally:
+            self._loading_page = False
+        if token == self._token:
+            with self.table.app.batch_update():
+                self._add_page(page)
+
+    def remove(self, record_id: int) -> bool:
+        """Remove a record's row in place; False if it is not shown."""
+        if self.records.pop(record_id, None) is None:
+            return False
+        self.table.remove_row(str(record_id))
+        return True
+
+    def _add_page(self, page: list) -> None:
+        """Append a page of rows and remember where it ended."""
+        self._track_page(page)
+        self._append(page)
+
+    def _track_page(self, page: list) -> None:
+        """Remember where ``page`` ended and whether another may follow."""
+        if page:
+            self._last_id = getattr(page[-1], self._id_attr)
+        self._has_more = len(page) == _PAGE_SIZE
+
+    def _append(self, records: list) -> None:
+        """Append rows for ``records``."""
+        self.records.update((getattr(r, self._id_attr), r) for r in records)
+        _add_keyed_rows(self.table, map(self._row, records))
+
+    def _reconcile_page(self, page: list) -> None:
+        """Make the table show ``page``, only touching rows that changed.
+
+        Rows whose record is gone or was edited are removed, new ones are
+        appended, and the table is re-sorted by ID only if both happened.
+        """
+        new = {getattr(r, self._id_attr): r for r in page}
+        for record_id in [
+            record_id
+            for record_id, record in self.records.items()
+            if new.get(record_id) != record
+        ]:
+            self.remove(record_id)
+
+        kept = bool(self.records)
+        added = [r for r in page if getattr(r, self._id_attr) not in self.records]
+        self._track_page(page)
+        self._append(added)
+        if kept and added:
+            self.table.sort("id", key=int)
@@ -0,0 +1,116 @@
+"""Order details screen."""
+
+from textual.app import ComposeResult
+from textual.containers import Container, Horizontal
+from textual.screen import Screen
+from textual.widgets import DataTable, Label
+
+from database.queries import get_order_by_id
+from tui.dialogs import ShortcutsBar
+
+
+class OrderViewScreen(Screen):
+    """Read-only view of one order and its items."""
+
+    CSS_PATH = "../css/main.tcss"
+
+    BINDINGS = [
+        ("escape", "go_back", "Back"),
+        ("q", "logout", "Logout"),
+    ]
+
+    def __init__(self, order_id: int) -> None:
+        self.order_id = order_id
+        self.order = None
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        with Container(classes="screen-layout"):
+            with Container(classes="workspace-header"):
+                yield Label("CTRL Market - Order Details", classes="workspace-title")
+
+            with Container(classes="workspace-content"):
+                with Container(classes="form-container"):
+                    yield Label(f"Order #{self.order_id}", classes="form-title")
+
+                    yield Label(
+                        "Order not found.",
+                        id="order-missing",
+                        classes="login-error",
+                    )
+
+                    with Container(id="order-content"):
+                        with Horizontal(classes="form-row"):
+                            yield Label("Customer:", classes="form-label")
+                            yield Label("", id="order-customer")
+
+                        with Horizontal(classes="form-row"):
+                            yield Label("Date:", classes="form-label")
+                            yield Label("", id="order-date")
+
+                        with Horizontal(classes="form-row"):
+                            yield Label("Status:", classes="form-label")
+                            yield Label("", id="order-status")
+
+                        with Horizontal(classes="form-row"):
+                            yield Label("Total:", classes="form-label")
+                            yield Label("", id="order-total")
+
+                        yield DataTable(id="order-items-table")
+
+            yield ShortcutsBar(id="shortcuts-bar", classes="shortcuts-bar")
+
+    def on_mount(self) -> None:
+        """Load the order and check the current user may see it."""
+        self.query_one("#order-missing", Label).display = False
+
+        current_user = getattr(self.app, "current_user", None)
+        order = get_order_by_id(self.order_id)
+        # Customers may only see their own orders.
+        if (
+            not order
+            or not current_user
+            or (
+                current_user.role == "Customer"
+                and order.user_id != current_user.user_id
+            )
+        ):
+            self.query_one("#order-content", Container).display = False
+            self.query_one("#order-missing", Label).display = True
+        else:
+            self.order = order
+            self.query_one("#order-customer", Label).update(
+                order.customer_name or "Unknown"
+            )
+            self.query_one("#order-date", Label).update(
+                order.order_date.strftime("%Y-%m-%d %H:%M") if order.order_date else ""
+            )
+            self.query_one("#order-status", Label).update(order.status)
+            self.query_one("#order-total", Label).update(
+                f"${order.total_price or 0:.2f}"
+            )
+
+            table = self.query_one("#order-items-table", DataTable)
+            table.cursor_type = "row"
+            table.add_columns("Product", "Category", "Qty", "Unit Price", "Subtotal")
+            table.add_rows(
+                (
+                    item.product_name,
+                    item.product_category,
+                    str(item.quantity),
+                    f"${item.unit_price:.2f}",
+                    f"${item.unit_price * item.quantity:.2f}",
+                )
+                for item in order.items
+            )
+
+        shortcuts_bar = self.query_one("#shortcuts-bar", ShortcutsBar)
+        shortcuts_bar.shortcuts = "\\[Esc]Back  \\[q]Logout"
+
+    def action_go_back(self) -> None:
+        """Go back."""
+        self.app.pop_screen()
+
+    def action_logout(self) -> None:
+        """Logout and return to login screen."""
+        self.app.logout()
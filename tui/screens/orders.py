@@ -9,10 +9,30 @@ from textual.widgets import Button, DataTable, Input, Label, Select, Static
 from database.queries import (
     cancel_order,
     get_order_by_id,
-    list_orders,
+    list_order_rows,
     update_order_status,
 )
-from models import OrderUpdateStatus, OrderWithItems
+from models import OrderRow, OrderUpdateStatus
+from tui.screens._table_common import (
+    _PAGE_SIZE,
+    _SIDEBAR_DIVIDER,
+    _PagedTable,
+    _row_key_id,
+)
+from tui.screens.order_new import OrderNewScreen
+from tui.screens.order_view import OrderViewScreen
+
+
+def _order_cells(order: OrderRow) -> tuple[str, ...]:
+    """Format an order as an orders table row."""
+    return (
+        str(order.order_id),
+        order.order_date or "",
+        order.customer_name or "Unknown",
+        order.total,
+        f"{order.item_count} items",
+        order.status,
+    )
 
 
 class OrdersScreen(Screen):
@@ -27,15 +47,18 @@ class OrdersScreen(Screen):
     ]
 
     def __init__(self) -> None:
-        self.orders: list[OrderWithItems] = []
         self.selected_order_id: int | None = None
         self.current_status_filter: str | None = None
+        self._orders: _PagedTable | None = None
+        self._table: DataTable | None = None
+        self._search_input: Input | None = None
+        self._status_select: Select | None = None
         super().__init__()
 
     def compose(self) -> ComposeResult:
         with Container(classes="sidebar"):
             yield Label("Orders", classes="sidebar-title")
-            yield Static("─" * 18)
+            yield Static(_SIDEBAR_DIVIDER)
             with Container(classes="sidebar-menu"):
                 yield Button("Back", id="btn-back", classes="sidebar-button")
                 yield Button("Refresh", id="btn-refresh", classes="sidebar-button")
@@ -73,9 +96,15 @@ class OrdersScreen(Screen):
             yield table
 
     def on_mount(self) -> None:
-        """Load orders when screen mounts."""
+        """Cache widgets and load orders when screen mounts."""
+        self._table = self.query_one("#orders-table", DataTable)
+        self._search_input = self.query_one("#search-input", Input)
+        self._status_select = self.query_one("#status-filter", Select)
+        self._orders = _PagedTable(
+            self._table, self._fetch_order_page, _order_cells, "order_id"
+        )
         self._update_ui_for_role()
-        self._load_orders()
+        self.run_worker(self._load_orders())
 
     def _update_ui_for_role(self) -> None:
         """Update UI based on user role."""
@@ -100,11 +129,19 @@ class OrdersScreen(Screen):
             # Admins have full access - all buttons visible
             pass
 
-    def _load_orders(self, search: str = "") -> None:
-        """Load orders into table."""
-        table = self.query_one("#orders-table", DataTable)
-        table.clear()
+    async def _load_orders(self, search: str = "") -> None:
+        """Show the first page of orders for the status filter and ``search``."""
+        await self._orders.load(
+            status=self.current_status_filter, search=search if search else None
+        )
 
+    def _fetch_order_page(
+        self,
+        status: str | None = None,
+        search: str | None = None,
+        after_id: int | None = None,
+    ) -> list[OrderRow]:
+        """Query a page of orders visible to the current user (thread-safe)."""
         current_user = getattr(self.app, "current_user", None)
 
         # Filter orders based on role and status filter
@@ -113,38 +150,20 @@ class OrdersScreen(Screen):
             # Customers only see their own orders
             user_id = current_user.user_id
 
-        self.orders = list_orders(
+        return list_order_rows(
             user_id=user_id,
-            status=self.current_status_filter,
-            search=search if search else None,
+            status=status,
+            search=search,
+            limit=_PAGE_SIZE,
+            after_id=after_id,
         )
 
-        for order in self.orders:
-            item_count = len(order.items)
-            table.add_row(
-                str(order.order_id),
-                str(order.order_date)[:16] if order.order_date else "",
-                order.customer_name or "Unknown",
-                f"${order.total_price:.2f}" if order.total_price else "$0.00",
-                f"{item_count} items",
-                order.status,
-            )
-
-    def _get_selected_order_id(self) -> int | None:
-        """Get order ID from currently highlighted row."""
-        table = self.query_one("#orders-table", DataTable)
-        if table.cursor_row is None:
-            return None
-        try:
-            row_data = table.get_row_at(table.cursor_row)
-            return int(row_data[0])
-        except (IndexError, ValueError):
-            return None
-
     @on(DataTable.RowHighlighted, "#orders-table")
     def on_datatable_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Track cursor movement to auto-select highlighted row."""
-        self.selected_order_id = self._get_selected_order_id()
+        self.selected_order_id = _row_key_id(event.row_key)
+        if self._orders.wants_more(event.cursor_row):
+            self.run_worker(self._orders.load_more())
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -153,7 +172,7 @@ class OrdersScreen(Screen):
         if btn_id == "btn-back":
             self.action_go_back()
         elif btn_id == "btn-refresh":
-            self._load_orders()
+            self.run_worker(self._load_orders())
         elif btn_id == "btn-new":
             self.action_new_order()
         elif btn_id == "btn-view":
@@ -169,24 +188,23 @@ class OrdersScreen(Screen):
 
     def _handle_filter(self) -> None:
         """Apply status filter."""
-        status_filter = self.query_one("#status-filter", Select)
-        selected_value = status_filter.value
+        selected_value = self._status_select.value
         # Handle NoSelection case
         if selected_value is None or str(selected_value) == "NoSelection":
             self.current_status_filter = None
         else:
             self.current_status_filter = str(selected_value) if selected_value else None
-        self._load_orders()
+        self.run_worker(self._load_orders())
 
     def _handle_search(self) -> None:
         """Apply search filter."""
-        search = self.query_one("#search-input", Input).value
-        self._load_orders(search=search)
+        search = self._search_input.value
+        self.run_worker(self._load_orders(search=search))
 
     def _handle_view(self) -> None:
         """View order details."""
         if self.selected_order_id:
-            self.app.push_screen(f"order_view:{self.selected_order_id}")
+            self.app.push_screen(OrderViewScreen(self.selected_order_id))
 
     def _handle_cancel(self) -> None:
         """Cancel selected order (customers can only cancel their own pending orders)."""
@@ -199,14 +217,14 @@ class OrdersScreen(Screen):
 
         # Check if customer is cancelling their own order
         if current_user.role == "Customer":
-            order = get_order_by_id(self.selected_order_id)
+            order = get_order_by_id(self.selected_order_id, with_items=False)
             if not order or order.user_id != current_user.user_id:
                 return  # Can't cancel other users' orders
             if order.status != "Pending":
                 return  # Can only cancel pending orders
 
         if cancel_order(self.selected_order_id):
-            self._load_orders()
+            self.run_worker(self._load_orders())
             self.selected_order_id = None
 
     def _handle_complete(self) -> None:
@@ -222,13 +240,13 @@ class OrdersScreen(Screen):
         if current_user.role not in ["Specialist", "Admin"]:
             return
 
-        order = get_order_by_id(self.selected_order_id)
+        order = get_order_by_id(self.selected_order_id, with_items=False)
         if not order or order.status != "Pending":
             return  # Can only complete pending orders
 
         update = OrderUpdateStatus(status="Completed")
         if update_order_status(self.selected_order_id, update):
-            self._load_orders()
+            self.run_worker(self._load_orders())
             self.selected_order_id = None
 
     def action_go_back(self) -> None:
@@ -241,4 +259,4 @@ class OrdersScreen(Screen):
 
     def action_new_order(self) -> None:
         """Open new order screen."""
-        self.app.push_screen("order_new")
+        self.app.push_screen(OrderNewScreen())
@@ -109,6 +109,7 @@ class ProductEditScreen(Screen):
 
         try:
             if update_product(self.product_id, update_data):
+                self.app.categories_stamp += 1
                 self.app.pop_screen()
         except Exception:
             pass
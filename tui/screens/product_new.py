@@ -91,6 +91,7 @@ class ProductNewScreen(Screen):
 
         try:
             create_product(product)
+            self.app.categories_stamp += 1
             self.app.pop_screen()
         except Exception:
             pass
@@ -1,5 +1,7 @@
 """Products management screen."""
 
+import asyncio
+
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container
@@ -13,7 +15,24 @@ from database.queries import (
     list_products,
 )
 from tui.dialogs import ConfirmDialog, ShortcutsBar
+from tui.screens._table_common import (
+    _PAGE_SIZE,
+    _SIDEBAR_DIVIDER,
+    _PagedTable,
+    _row_key_id,
+)
 from tui.screens.product_edit import ProductEditScreen
+from tui.screens.product_new import ProductNewScreen
+
+
+def _product_cells(product) -> tuple[str, ...]:
+    """Format a product as a products table row."""
+    return (
+        str(product.product_id),
+        product.name,
+        product.category,
+        f"${product.price:.2f}",
+    )
 
 
 class ProductsScreen(Screen):
@@ -30,15 +49,19 @@ class ProductsScreen(Screen):
     ]
 
     def __init__(self) -> None:
-        self.products: list = []
         self.categories: list[str] = []
         self.selected_product_id: int | None = None
+        self._products: _PagedTable | None = None
+        self._table: DataTable | None = None
+        self._search_input: Input | None = None
+        self._category_select: Select | None = None
+        self._shortcuts_bar: ShortcutsBar | None = None
         super().__init__()
 
     def compose(self) -> ComposeResult:
         with Container(classes="sidebar"):
             yield Label("Products", classes="sidebar-title")
-            yield Static("─" * 18)
+            yield Static(_SIDEBAR_DIVIDER)
             with Container(classes="sidebar-menu"):
                 yield Button("Back", id="btn-back", classes="sidebar-button")
                 yield Button("Refresh", id="btn-refresh", classes="sidebar-button")
@@ -70,10 +93,17 @@ class ProductsScreen(Screen):
         yield ShortcutsBar(id="shortcuts-bar", classes="shortcuts-bar")
 
     def on_mount(self) -> None:
-        """Load data when screen mounts."""
-        self._load_categories()
-        self._load_products()
+        """Cache widgets and load data when screen mounts."""
+        self._table = self.query_one("#products-table", DataTable)
+        self._search_input = self.query_one("#search-input", Input)
+        self._category_select = self.query_one("#category-select", Select)
+        self._products = _PagedTable(
+            self._table, self._fetch_product_page, _product_cells, "product_id"
+        )
+        self._shortcuts_bar = self.query_one("#shortcuts-bar", ShortcutsBar)
         self._update_ui_for_role()
+        self.run_worker(self._load_categories())
+        self.run_worker(self._load_products())
 
     def _update_ui_for_role(self) -> None:
         """Update UI based on user role."""
@@ -97,48 +127,38 @@ class ProductsScreen(Screen):
             shortcuts.append("\\[n]New \\[e]Edit \\[d]Delete \\[q]Logout")
         shortcuts.append("\\[r]Refresh")
 
-        shortcuts_bar = self.query_one("#shortcuts-bar", ShortcutsBar)
-        shortcuts_bar.shortcuts = "  |  ".join(shortcuts)
+        self._shortcuts_bar.shortcuts = "  |  ".join(shortcuts)
 
-    def _load_categories(self) -> None:
+    async def _load_categories(self) -> None:
         """Load product categories for dropdown."""
-        self.categories = ["All Categories"] + list_product_categories()
-        select = self.query_one("#category-select", Select)
-        select.set_options([(c, c) for c in self.categories])
-
-    def _load_products(self, search: str = "", category: str = "") -> None:
-        """Load products into table."""
-        table = self.query_one("#products-table", DataTable)
-        table.clear()
-
-        cat_filter = None if category in ("", "All Categories") else category
-        self.products = list_products(
-            category=cat_filter, search=search if search else None
+        categories = await asyncio.to_thread(list_product_categories)
+        self.categories = ["All Categories"] + categories
+        self._category_select.set_options([(c, c) for c in self.categories])
+
+    async def _load_products(self, search: str = "", category: str = "") -> None:
+        """Show the first page of products for the given filters."""
+        await self._products.load(
+            category=None if category in ("", "All Categories") else category,
+            search=search if search else None,
         )
 
-        for product in self.products:
-            table.add_row(
-                str(product.product_id),
-                product.name,
-                product.category,
-                f"${product.price:.2f}",
-            )
-
-    def _get_selected_product_id(self) -> int | None:
-        """Get product ID from currently highlighted row."""
-        table = self.query_one("#products-table", DataTable)
-        if table.cursor_row is None:
-            return None
-        try:
-            row_data = table.get_row_at(table.cursor_row)
-            return int(row_data[0])
-        except (IndexError, ValueError):
-            return None
+    @staticmethod
+    def _fetch_product_page(
+        category: str | None = None,
+        search: str | None = None,
+        after_id: int | None = None,
+    ) -> list:
+        """Query a page of products (thread-safe)."""
+        return list_products(
+            category=category, search=search, limit=_PAGE_SIZE, after_id=after_id
+        )
 
     @on(DataTable.RowHighlighted, "#products-table")
     def on_datatable_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Track cursor movement to auto-select highlighted row."""
-        self.selected_product_id = self._get_selected_product_id()
+        self.selected_product_id = _row_key_id(event.row_key)
+        if self._products.wants_more(event.cursor_row):
+            self.run_worker(self._products.load_more())
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -147,7 +167,7 @@ class ProductsScreen(Screen):
         if btn_id == "btn-back":
             self.action_go_back()
         elif btn_id == "btn-refresh":
-            self._load_products()
+            self.run_worker(self._load_products())
         elif btn_id == "btn-new":
             self.action_new_product()
         elif btn_id == "btn-search":
@@ -159,10 +179,10 @@ class ProductsScreen(Screen):
 
     def _handle_search(self) -> None:
         """Handle search."""
-        search = self.query_one("#search-input", Input).value
-        category = self.query_one("#category-select", Select).value
-        cat_str = category if category != Select.BLANK else ""
-        self._load_products(search=search, category=cat_str)
+        search = self._search_input.value
+        category = self._category_select
+        cat_str = "" if category.is_blank() else str(category.value)
+        self.run_worker(self._load_products(search=search, category=cat_str))
 
     def _handle_edit(self) -> None:
         """Handle edit button."""
@@ -185,11 +205,12 @@ class ProductsScreen(Screen):
         def confirm_delete(confirmed: bool) -> None:
             if confirmed:
                 if delete_product(self.selected_product_id):
+                    self.app.categories_stamp += 1
                     self.notify(
                         f"Product '{product.name}' deleted successfully",
                         severity="information",
                     )
-                    self._load_products()
+                    self.run_worker(self._load_products())
                     self.selected_product_id = None
                 else:
                     self.notify(
@@ -215,7 +236,7 @@ class ProductsScreen(Screen):
 
     def action_new_product(self) -> None:
         """Open new product dialog."""
-        self.app.push_screen("product_new")
+        self.app.push_screen(ProductNewScreen())
 
     def action_edit_product(self) -> None:
         """Edit selected product."""
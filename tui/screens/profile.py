@@ -1,9 +1,10 @@
 """Profile screen with user info, logout, and users management for admins."""
 
+from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
-from textual.reactive import reactive
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     DataTable,
     Input,
@@ -14,17 +15,13 @@ from textual.widgets import (
     TabPane,
 )
 
-from database.queries import delete_user, get_user_by_id, list_users
-
-
-class ShortcutsBar(Static):
-    """Bar at bottom showing keyboard shortcuts for current context."""
-
-    shortcuts = reactive("")
-
-    def watch_shortcuts(self, shortcuts: str) -> None:
-        """Update display when shortcuts change."""
-        self.update(shortcuts)
+from database.queries import delete_user, get_user_by_id
+from tui.dialogs import ShortcutsBar
+from tui.screens._signup_common import _UserImportMixin
+from tui.screens._table_common import _PagedTable, _row_key_id
+from tui.screens.user_edit import UserEditScreen
+from tui.screens.user_new import UserNewScreen
+from tui.screens.users import _SEARCH_DEBOUNCE, _fetch_user_page, _user_cells
 
 
 class ProfileSection(Container):
@@ -68,18 +65,19 @@ class UsersSection(Container):
                 id="role-filter",
             )
             yield Input(
-                placeholder="Search users... (Press Enter)",
+                placeholder="Search users...",
                 id="users-search",
                 classes="search-input",
             )
         # Users table
         table = DataTable(id="users-table")
-        table.add_columns("ID", "Name", "Email", "Phone", "Role")
+        table.add_column("ID", key="id")
+        table.add_columns("Name", "Email", "Phone", "Role")
         table.cursor_type = "row"
         yield table
 
 
-class ProfileScreen(Screen):
+class ProfileScreen(_UserImportMixin, Screen):
     """Profile screen with user info and admin users management."""
 
     CSS_PATH = "../css/main.tcss"
@@ -92,14 +90,16 @@ class ProfileScreen(Screen):
         ("n", "new_user", "New User"),
         ("e", "edit_user", "Edit"),
         ("d", "delete_user", "Delete"),
+        ("i", "import_users", "Import CSV"),
         ("r", "refresh", "Refresh"),
         ("ctrl+s", "focus_search", "Focus Search"),
         ("/", "focus_search", "Focus Search"),
     ]
 
     def __init__(self) -> None:
-        self.users: list = []
         self.selected_user_id: int | None = None
+        self._users: _PagedTable | None = None
+        self._search_timer: Timer | None = None
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -129,7 +129,14 @@ class ProfileScreen(Screen):
         current_user = getattr(self.app, "current_user", None)
         is_admin = current_user and current_user.role == "Admin"
         if is_admin:
-            self._load_users()
+            self._users = _PagedTable(
+                self.query_one("#users-table", DataTable),
+                _fetch_user_page,
+                _user_cells,
+                "user_id",
+                reconcile=True,
+            )
+            self.run_worker(self._load_users())
         self._update_shortcuts()
 
     def on_screen_resume(self) -> None:
@@ -138,7 +145,7 @@ class ProfileScreen(Screen):
         current_user = getattr(self.app, "current_user", None)
         is_admin = current_user and current_user.role == "Admin"
         if is_admin:
-            self._load_users()
+            self.run_worker(self._load_users())
         self._update_shortcuts()
 
     def _load_profile(self) -> None:
@@ -153,19 +160,20 @@ class ProfileScreen(Screen):
                 self.query_one("#profile-phone", Label).update(user.phone or "N/A")
                 self.query_one("#profile-role", Label).update(user.role)
 
-    def _load_users(self, role: str = "", search: str = "") -> None:
-        """Load users into table."""
-        table = self.query_one("#users-table", DataTable)
-        if table:
-            table.clear()
-
-            role_filter = role if role else None
-            self.users = list_users(role=role_filter, search=search if search else None)
-
-            for user in self.users:
-                table.add_row(
-                    str(user.user_id), user.name, user.email, user.phone, user.role
-                )
+    async def _load_users(self) -> None:
+        """Show the first page of users for the current filters.
+
+        Reloads reconcile against the rows already shown, so returning from an
+        edit only touches the rows that changed.
+        """
+        role = self.query_one("#role-filter", Select).value
+        search = self.query_one("#users-search", Input).value
+        loaded = await self._users.load(
+            role=str(role) if role and role != Select.BLANK else None,
+            search=search or None,
+        )
+        if loaded and self.selected_user_id not in self._users.records:
+            self.selected_user_id = None
 
     def _update_shortcuts(self) -> None:
         """Update shortcuts bar based on current tab and role."""
@@ -183,7 +191,9 @@ class ProfileScreen(Screen):
             try:
                 tabbed = self.query_one(TabbedContent)
                 if tabbed.active == "users":
-                    shortcuts.append("\\[n]New \\[e]Edit \\[d]Delete \\[/]Search")
+                    shortcuts.append(
+                        "\\[n]New \\[e]Edit \\[d]Delete \\[i]Import \\[/]Search"
+                    )
             except Exception:
                 pass
             shortcuts.append("\\[r]Refresh")
@@ -191,32 +201,43 @@ class ProfileScreen(Screen):
         shortcuts_bar = self.query_one("#shortcuts-bar", ShortcutsBar)
         shortcuts_bar.shortcuts = "  |  ".join(shortcuts)
 
+    @on(DataTable.RowHighlighted, "#users-table")
+    def on_users_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Load the next page when the cursor reaches the last loaded row."""
+        if self._users.wants_more(event.cursor_row):
+            self.run_worker(self._users.load_more())
+
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection."""
         if event.data_table.id == "users-table":
-            row_data = event.data_table.get_row(event.row_key)
-            self.selected_user_id = int(row_data[0])
+            self.selected_user_id = _row_key_id(event.row_key)
 
     def on_tabbed_content_tab_activated(self) -> None:
         """Update shortcuts when tab changes."""
         self._update_shortcuts()
 
-    def on_input_submitted(self, event: Input.Submitted) -> None:
-        """Handle search input submission."""
-        if event.input.id == "users-search":
-            search = event.value
-            role_filter = self.query_one("#role-filter", Select)
-            role = str(role_filter.value) if role_filter.value != Select.BLANK else ""
-            self._load_users(role=role, search=search)
-
-    def on_select_changed(self, event: Select.Changed) -> None:
+    @on(Input.Changed, "#users-search")
+    def on_users_search_changed(self) -> None:
+        """Filter as the user types, debounced so a burst issues one query."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(_SEARCH_DEBOUNCE, self._search_users)
+
+    @on(Input.Submitted, "#users-search")
+    def on_users_search_submitted(self) -> None:
+        """Search right away on Enter."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_users()
+
+    @on(Select.Changed, "#role-filter")
+    def on_role_filter_changed(self) -> None:
         """Handle filter change."""
-        if event.select.id == "role-filter":
-            value = event.value
-            role = str(value) if value != Select.BLANK else ""
-            search_input = self.query_one("#users-search", Input)
-            search = search_input.value if search_input else ""
-            self._load_users(role=role, search=search)
+        self._search_users()
+
+    def _search_users(self) -> None:
+        """Reload the users table for the current filters."""
+        self.run_worker(self._load_users())
 
     def action_switch_tab(self, tab_id: str) -> None:
         """Switch to specified tab."""
@@ -256,7 +277,7 @@ class ProfileScreen(Screen):
         if not current_user or current_user.role != "Admin":
             return
 
-        self.app.push_screen("user_new")
+        self.app.push_screen(UserNewScreen())
 
     def action_edit_user(self) -> None:
         """Edit selected user."""
@@ -265,7 +286,7 @@ class ProfileScreen(Screen):
             return
 
         if self.selected_user_id:
-            self.app.push_screen(f"user_edit:{self.selected_user_id}")
+            self.app.push_screen(UserEditScreen(self.selected_user_id))
 
     def action_delete_user(self) -> None:
         """Delete selected user."""
@@ -278,8 +299,8 @@ class ProfileScreen(Screen):
             return
 
         if delete_user(user_id):
-            self._load_users()
             self.selected_user_id = None
+            self._users.remove(user_id)
 
     def action_refresh(self) -> None:
         """Refresh data."""
@@ -287,4 +308,4 @@ class ProfileScreen(Screen):
         current_user = getattr(self.app, "current_user", None)
         is_admin = current_user and current_user.role == "Admin"
         if is_admin:
-            self._load_users()
+            self.run_worker(self._load_users())
@@ -11,6 +11,11 @@ from textual.widgets import Input, Label, Select, Static
 from database.queries import create_service_request, list_customers
 from models import ServiceRequestCreate
 
+_SERVICE_TYPE_OPTIONS = (
+    ("Installation", "Installation"),
+    ("Support", "Support"),
+)
+
 
 class ShortcutsBar(Static):
     """Bar at bottom showing keyboard shortcuts."""
@@ -60,10 +65,7 @@ class ServiceNewScreen(Screen):
                     with Horizontal(classes="form-row"):
                         yield Label("Service Type:", classes="form-label")
                         yield Select(
-                            [
-                                ("Installation", "Installation"),
-                                ("Support", "Support"),
-                            ],
+                            _SERVICE_TYPE_OPTIONS,
                             id="service-type",
                             value="Installation",
                         )
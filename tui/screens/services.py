@@ -8,11 +8,37 @@ from textual.widgets import Button, DataTable, Input, Label, Select, Static
 
 from database.queries import (
     assign_specialist,
-    list_service_requests,
-    list_service_requests_for_specialist,
+    list_service_request_rows,
     update_service_request_status,
 )
 from models import ServiceRequestUpdateStatus
+from tui.screens._table_common import (
+    _PAGE_SIZE,
+    _SIDEBAR_DIVIDER,
+    _PagedTable,
+    _row_key_id,
+)
+from tui.screens.service_new import ServiceNewScreen
+
+_STATUS_FILTER_OPTIONS = (
+    ("All", ""),
+    ("Pending", "Pending"),
+    ("In Progress", "In Progress"),
+    ("Completed", "Completed"),
+    ("Cancelled", "Cancelled"),
+)
+
+
+def _request_cells(req) -> tuple[str, ...]:
+    """Format a service request as a requests table row."""
+    return (
+        str(req.request_id),
+        req.request_date or "",
+        req.service_type,
+        req.status,
+        req.customer_name,
+        req.specialist_name or "Unassigned",
+    )
 
 
 class ServicesScreen(Screen):
@@ -27,14 +53,17 @@ class ServicesScreen(Screen):
     ]
 
     def __init__(self) -> None:
-        self.requests: list = []
         self.selected_request_id: int | None = None
+        self._requests: _PagedTable | None = None
+        self._table: DataTable | None = None
+        self._search_input: Input | None = None
+        self._status_select: Select | None = None
         super().__init__()
 
     def compose(self) -> ComposeResult:
         with Container(classes="sidebar"):
             yield Label("Services", classes="sidebar-title")
-            yield Static("─" * 18)
+            yield Static(_SIDEBAR_DIVIDER)
             with Container(classes="sidebar-menu"):
                 yield Button("Back", id="btn-back", classes="sidebar-button")
                 yield Button("Refresh", id="btn-refresh", classes="sidebar-button")
@@ -56,13 +85,7 @@ class ServicesScreen(Screen):
                 )
                 yield Label("Filter:", classes="form-label")
                 yield Select(
-                    [
-                        ("All", ""),
-                        ("Pending", "Pending"),
-                        ("In Progress", "In Progress"),
-                        ("Completed", "Completed"),
-                        ("Cancelled", "Cancelled"),
-                    ],
+                    _STATUS_FILTER_OPTIONS,
                     id="status-filter",
                     value="",
                 )
@@ -75,9 +98,15 @@ class ServicesScreen(Screen):
             yield table
 
     def on_mount(self) -> None:
-        """Load requests when screen mounts."""
+        """Cache widgets and load requests when screen mounts."""
+        self._table = self.query_one("#requests-table", DataTable)
+        self._search_input = self.query_one("#search-input", Input)
+        self._status_select = self.query_one("#status-filter", Select)
+        self._requests = _PagedTable(
+            self._table, self._fetch_request_page, _request_cells, "request_id"
+        )
         self._update_ui_for_role()
-        self._load_requests()
+        self.run_worker(self._load_requests())
 
     def _update_ui_for_role(self) -> None:
         """Update UI based on user role."""
@@ -96,81 +125,60 @@ class ServicesScreen(Screen):
             # Specialists can manage requests but not create new ones
             self.query_one("#btn-new", Button).display = False
 
-    def _load_requests(self, status: str = "", search: str = "") -> None:
-        """Load service requests based on user role."""
-        table = self.query_one("#requests-table", DataTable)
-        table.clear()
+    async def _load_requests(self, status: str = "", search: str = "") -> None:
+        """Show the first page of service requests for the current role."""
+        await self._requests.load(
+            status=status if status else None, search=search if search else None
+        )
 
+    def _fetch_request_page(
+        self,
+        status: str | None = None,
+        search: str | None = None,
+        after_id: int | None = None,
+    ) -> list:
+        """Query a page of requests visible to the current user (thread-safe)."""
         current_user = getattr(self.app, "current_user", None)
-        status_filter = status if status else None
-
-        # Filter requests based on role
-        if current_user:
-            if current_user.role == "Customer":
-                # Customers only see their own requests
-                self.requests = list_service_requests(
-                    status=status_filter,
-                    customer_id=current_user.user_id,
-                    search=search if search else None,
-                )
-            elif current_user.role == "Specialist":
-                # Specialists see unassigned and their assigned requests
-                self.requests = list_service_requests_for_specialist(
-                    current_user.user_id
-                )
-                # Apply status filter manually for specialists
-                if status_filter:
-                    self.requests = [
-                        r for r in self.requests if r.status == status_filter
-                    ]
-            else:
-                # Admins see all requests
-                self.requests = list_service_requests(
-                    status=status_filter, search=search if search else None
-                )
-        else:
-            self.requests = []
-
-        for req in self.requests:
-            specialist = req.specialist_name or "Unassigned"
-            table.add_row(
-                str(req.request_id),
-                str(req.request_date)[:16] if req.request_date else "",
-                req.service_type,
-                req.status,
-                req.customer_name,
-                specialist,
-            )
-
-    def _get_selected_request_id(self) -> int | None:
-        """Get request ID from currently highlighted row."""
-        table = self.query_one("#requests-table", DataTable)
-        if table.cursor_row is None:
-            return None
-        try:
-            row_data = table.get_row_at(table.cursor_row)
-            return int(row_data[0])
-        except (IndexError, ValueError):
-            return None
+        if not current_user:
+            return []
+        customer_id = None
+        specialist_id = None
+        # Customers see their own requests, specialists see unassigned and
+        # their assigned requests, admins see all requests
+        if current_user.role == "Customer":
+            customer_id = current_user.user_id
+        elif current_user.role == "Specialist":
+            specialist_id = current_user.user_id
+
+        return list_service_request_rows(
+            status=status,
+            customer_id=customer_id,
+            search=search,
+            limit=_PAGE_SIZE,
+            after_id=after_id,
+            available_to_specialist=specialist_id,
+        )
 
     @on(DataTable.RowHighlighted, "#requests-table")
     def on_datatable_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Track cursor movement to auto-select highlighted row."""
-        self.selected_request_id = self._get_selected_request_id()
+        self.selected_request_id = _row_key_id(event.row_key)
+        if self._requests.wants_more(event.cursor_row):
+            self.run_worker(self._requests.load_more())
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle filter change."""
         if event.select.id == "status-filter":
             value = event.value
             status = str(value) if value != Select.BLANK else ""
-            self._load_requests(status=status)
+            self.run_worker(self._load_requests(status=status))
 
     def _handle_search(self) -> None:
         """Apply search filter."""
-        search = self.query_one("#search-input", Input).value
-        status_filter = self.query_one("#status-filter", Select)
+        search = self._search_input.value
+        status_filter = self._status_select
         status = str(status_filter.value) if status_filter.value != Select.BLANK else ""
-        self._load_requests(status=status, search=search)
+        self.run_worker(self._load_requests(status=status, search=search))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -179,7 +187,7 @@ class ServicesScreen(Screen):
         if btn_id == "btn-back":
             self.action_go_back()
         elif btn_id == "btn-refresh":
-            self._load_requests()
+            self.run_worker(self._load_requests())
         elif btn_id == "btn-new":
             self.action_new_request()
         elif btn_id == "btn-assign":
@@ -201,7 +209,7 @@ class ServicesScreen(Screen):
             return
 
         assign_specialist(self.selected_request_id, current_user.user_id)
-        self._load_requests()
+        self.run_worker(self._load_requests())
 
     def _handle_complete(self) -> None:
         """Mark request as completed."""
@@ -219,7 +227,7 @@ class ServicesScreen(Screen):
         update_service_request_status(
             self.selected_request_id, ServiceRequestUpdateStatus(status="Completed")
         )
-        self._load_requests()
+        self.run_worker(self._load_requests())
 
     def _handle_cancel(self) -> None:
         """Cancel request."""
@@ -237,7 +245,7 @@ class ServicesScreen(Screen):
         update_service_request_status(
             self.selected_request_id, ServiceRequestUpdateStatus(status="Cancelled")
         )
-        self._load_requests()
+        self.run_worker(self._load_requests())
 
     def action_go_back(self) -> None:
         """Go back to dashboard."""
@@ -249,4 +257,4 @@ class ServicesScreen(Screen):
 
     def action_new_request(self) -> None:
         """Open new request dialog."""
-        self.app.push_screen("service_new")
+        self.app.push_screen(ServiceNewScreen())
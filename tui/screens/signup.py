@@ -1,24 +1,20 @@
 """Signup screen for user registration."""
 
-import bcrypt
+import asyncio
+
 from textual.app import ComposeResult
 from textual.containers import Container
-from textual.reactive import reactive
 from textual.screen import Screen
 from textual.widgets import Input, Label, Select, Static
 
 from database.queries import create_user, get_user_by_email
 from models import SessionUser, UserCreate
-
-
-class ShortcutsBar(Static):
-    """Bar at bottom showing keyboard shortcuts."""
-
-    shortcuts = reactive("")
-
-    def watch_shortcuts(self, shortcuts: str) -> None:
-        """Update display when shortcuts change."""
-        self.update(shortcuts)
+from tui.dialogs import ShortcutsBar
+from tui.screens._signup_common import (
+    _ROLE_OPTIONS,
+    _hash_password,
+    _validate_signup,
+)
 
 
 class SignupScreen(Screen):
@@ -33,6 +29,7 @@ class SignupScreen(Screen):
 
     def __init__(self) -> None:
         self.error_label: Label | None = None
+        self._submitting = False
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -58,11 +55,7 @@ class SignupScreen(Screen):
 
                 yield Label("Role:")
                 yield Select(
-                    [
-                        ("Customer", "Customer"),
-                        ("Specialist", "Specialist"),
-                        ("Admin", "Admin"),
-                    ],
+                    _ROLE_OPTIONS,
                     allow_blank=False,
                     value="Customer",
                     id="role",
@@ -95,8 +88,18 @@ class SignupScreen(Screen):
         shortcuts_bar.shortcuts = "\\[Enter]Sign Up \\[Alt+1]Back to Login"
         yield shortcuts_bar
 
-    def action_signup(self) -> None:
+    async def action_signup(self) -> None:
         """Handle signup action."""
+        if self._submitting:
+            return
+        self._submitting = True
+        try:
+            await self._do_signup()
+        finally:
+            self._submitting = False
+
+    async def _do_signup(self) -> bool:
+        """Validate the form, create the account and log in; return success."""
         name = self.query_one("#name", Input).value.strip()
         email = self.query_one("#email", Input).value.strip()
         phone = self.query_one("#phone", Input).value.strip()
@@ -104,39 +107,27 @@ class SignupScreen(Screen):
         password = self.query_one("#password", Input).value
         confirm_password = self.query_one("#confirm_password", Input).value
 
-        # Validate required fields
-        if not all([name, email, phone, password]):
-            if self.error_label:
-                self.error_label.update("Please fill in all required fields")
-            return
-
-        # Validate password match
-        if password != confirm_password:
+        # Validate required fields, password match and length
+        error = _validate_signup(name, email, phone, password, confirm_password)
+        if error:
             if self.error_label:
-                self.error_label.update("Passwords do not match")
-            return
-
-        # Validate password length
-        if len(password) < 6:
-            if self.error_label:
-                self.error_label.update("Password must be at least 6 characters")
-            return
+                self.error_label.update(error)
+            return False
 
         # Get role value safely
         role_value = role_select.value
-        if role_value is None or role_value == Select.BLANK:
-            role: str = "Customer"
-        elif hasattr(role_value, "value"):
-            role = role_value.value
-        else:
-            role = str(role_value)
+        role = (
+            "Customer"
+            if role_value in (None, Select.BLANK)
+            else str(getattr(role_value, "value", role_value))
+        )
 
         # Check for duplicate email
         existing_user = get_user_by_email(email)
         if existing_user:
             if self.error_label:
                 self.error_label.update("Email already registered")
-            return
+            return False
 
         # Create user with Pydantic validation
         try:
@@ -150,10 +141,12 @@ class SignupScreen(Screen):
         except Exception as e:
             if self.error_label:
                 self.error_label.update(f"Validation error: {e}")
-            return
+            return False
 
-        # Hash password
-        password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        # Hash password on a worker thread so the UI keeps responding
+        if self.error_label:
+            self.error_label.update("Creating account...")
+        password_hash = await asyncio.to_thread(_hash_password, password)
 
         # Create user in database
         try:
@@ -161,14 +154,14 @@ class SignupScreen(Screen):
         except Exception as e:
             if self.error_label:
                 self.error_label.update(f"Failed to create account: {e}")
-            return
+            return False
 
         # Auto-login: Create session user and navigate to dashboard
         user_id = new_user.user_id
         if user_id is None:
             if self.error_label:
                 self.error_label.update("Failed to create user")
-            return
+            return False
 
         session_user = SessionUser(
             user_id=user_id,
@@ -179,11 +172,12 @@ class SignupScreen(Screen):
 
         self.app.current_user = session_user
         self.app.push_screen("dashboard")
+        return True
 
     def action_go_back(self) -> None:
         """Navigate back to login screen."""
         self.app.pop_screen()
 
-    def _on_input_submitted(self, event: Input.Submitted) -> None:
+    async def _on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in any input field."""
-        self.action_signup()
+        await self.action_signup()
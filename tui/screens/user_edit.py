@@ -0,0 +1,131 @@
+"""User edit screen."""
+
+from textual.app import ComposeResult
+from textual.containers import Container, Horizontal
+from textual.screen import Screen
+from textual.widgets import Input, Label, Select
+
+from database.queries import get_user_by_id, update_user
+from models import UserUpdate
+from tui.dialogs import ShortcutsBar
+from tui.screens._signup_common import _EMAIL_RE, _ROLE_OPTIONS
+
+
+class UserEditScreen(Screen):
+    """Edit existing user screen."""
+
+    CSS_PATH = "../css/main.tcss"
+
+    BINDINGS = [
+        ("escape", "go_back", "Back"),
+        ("ctrl+enter", "save_user", "Save User"),
+        ("q", "logout", "Logout"),
+    ]
+
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+        self.user = None
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        with Container(classes="screen-layout"):
+            with Container(classes="workspace-header"):
+                yield Label("CTRL Market - Edit User", classes="workspace-title")
+
+            with Container(classes="workspace-content"):
+                with Container(classes="form-container"):
+                    yield Label("Edit User", classes="form-title")
+
+                    yield Label(
+                        "Access Denied: Only Admins can edit users.",
+                        id="access-denied",
+                        classes="login-error",
+                    )
+
+                    with Container(id="form-content"):
+                        with Horizontal(classes="form-row"):
+                            yield Label("Name:", classes="form-label")
+                            yield Input(
+                                placeholder="Full name", id="name", max_length=100
+                            )
+
+                        with Horizontal(classes="form-row"):
+                            yield Label("Email:", classes="form-label")
+                            yield Input(
+                                placeholder="Email address", id="email", max_length=100
+                            )
+
+                        with Horizontal(classes="form-row"):
+                            yield Label("Phone:", classes="form-label")
+                            yield Input(
+                                placeholder="Phone number", id="phone", max_length=20
+                            )
+
+                        with Horizontal(classes="form-row"):
+                            yield Label("Role:", classes="form-label")
+                            yield Select(_ROLE_OPTIONS, id="role", allow_blank=False)
+
+            yield ShortcutsBar(id="shortcuts-bar", classes="shortcuts-bar")
+
+    def on_mount(self) -> None:
+        """Load user data and check permissions."""
+        self.query_one("#access-denied", Label).display = False
+
+        current_user = getattr(self.app, "current_user", None)
+
+        if not current_user or current_user.role != "Admin":
+            self.query_one("#form-content", Container).display = False
+            self.query_one("#access-denied", Label).display = True
+            return
+
+        self.user = get_user_by_id(self.user_id)
+        if self.user:
+            self.query_one("#name", Input).value = self.user.name
+            self.query_one("#email", Input).value = self.user.email
+            self.query_one("#phone", Input).value = self.user.phone
+            self.query_one("#role", Select).value = self.user.role
+
+        shortcuts_bar = self.query_one("#shortcuts-bar", ShortcutsBar)
+        shortcuts_bar.shortcuts = "\\[Ctrl+Enter]Save User  \\[Esc]Back  \\[q]Logout"
+
+    def action_save_user(self) -> None:
+        """Save the user changes."""
+        current_user = getattr(self.app, "current_user", None)
+        if not current_user or current_user.role != "Admin":
+            return
+
+        if not self.user:
+            return
+
+        name = self.query_one("#name", Input).value.strip()
+        email = self.query_one("#email", Input).value.strip()
+        phone = self.query_one("#phone", Input).value.strip()
+        role = str(self.query_one("#role", Select).value)
+
+        if not (name and email and phone):
+            self.notify("Please fill in all required fields", severity="error")
+            return
+        if not _EMAIL_RE.fullmatch(email):
+            self.notify("Invalid email address", severity="error")
+            return
+
+        update_data = UserUpdate(
+            name=name if name != self.user.name else None,
+            email=email if email != self.user.email else None,
+            phone=phone if phone != self.user.phone else None,
+            role=role if role != self.user.role else None,
+        )
+
+        try:
+            if update_user(self.user_id, update_data):
+                self.app.pop_screen()
+        except Exception as e:
+            self.notify(f"Failed to update user: {e}", severity="error")
+
+    def action_go_back(self) -> None:
+        """Go back."""
+        self.app.pop_screen()
+
+    def action_logout(self) -> None:
+        """Logout and return to login screen."""
+        self.app.logout()
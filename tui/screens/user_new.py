@@ -1,5 +1,7 @@
 """New user creation screen."""
 
+import asyncio
+import queue
 from typing import Literal, cast
 
 import bcrypt
@@ -11,6 +13,13 @@ from textual.widgets import Input, Label, Select, Static
 
 from database.queries import create_user
 from models import UserCreate
+from tui.screens._signup_common import (
+    _ROLE_OPTIONS,
+    _hash_password,
+    _validate_signup,
+)
+
+_SALT_POOL_SIZE = 4
 
 
 class ShortcutsBar(Static):
@@ -34,6 +43,13 @@ class UserNewScreen(Screen):
         ("q", "logout", "Logout"),
     ]
 
+    def __init__(self) -> None:
+        self._submitting = False
+        self._salt_queue: queue.Queue[bytes] = queue.Queue(maxsize=_SALT_POOL_SIZE)
+        self._inputs: dict[str, Input] = {}
+        self._role_select: Select | None = None
+        super().__init__()
+
     def compose(self) -> ComposeResult:
         # Header
         with Container(classes="workspace-header"):
@@ -46,24 +62,20 @@ class UserNewScreen(Screen):
 
                 with Horizontal(classes="form-row"):
                     yield Label("Name:", classes="form-label")
-                    yield Input(placeholder="Full name", id="name")
+                    yield Input(placeholder="Full name", id="name", max_length=100)
 
                 with Horizontal(classes="form-row"):
                     yield Label("Email:", classes="form-label")
-                    yield Input(placeholder="Email address", id="email")
+                    yield Input(placeholder="Email address", id="email", max_length=100)
 
                 with Horizontal(classes="form-row"):
                     yield Label("Phone:", classes="form-label")
-                    yield Input(placeholder="Phone number", id="phone")
+                    yield Input(placeholder="Phone number", id="phone", max_length=20)
 
                 with Horizontal(classes="form-row"):
                     yield Label("Role:", classes="form-label")
                     yield Select(
-                        [
-                            ("Customer", "Customer"),
-                            ("Specialist", "Specialist"),
-                            ("Admin", "Admin"),
-                        ],
+                        _ROLE_OPTIONS,
                         id="role",
                         value="Customer",
                     )
@@ -77,35 +89,82 @@ class UserNewScreen(Screen):
         shortcuts_bar.shortcuts = "\\[Esc]Back \\[c]Create User"
         yield shortcuts_bar
 
+    def on_mount(self) -> None:
+        """Cache form widgets and pre-generate bcrypt salts."""
+        self._inputs = {
+            k: self.query_one(f"#{k}", Input)
+            for k in ("name", "email", "phone", "password")
+        }
+        self._role_select = self.query_one("#role", Select)
+        self.run_worker(self._refill_salts, thread=True, group="salts")
+
+    def _refill_salts(self) -> None:
+        """Top up the salt pool (runs on a worker thread)."""
+        rounds = getattr(self.app, "bcrypt_rounds", 12)
+        while True:
+            try:
+                # Never block: a concurrent refill may fill the last slot.
+                self._salt_queue.put_nowait(bcrypt.gensalt(rounds=rounds))
+            except queue.Full:
+                break
+
+    def _take_salt(self) -> bytes:
+        """Take a pre-generated salt, or generate one if the pool is empty."""
+        try:
+            salt = self._salt_queue.get_nowait()
+        except queue.Empty:
+            salt = bcrypt.gensalt(rounds=getattr(self.app, "bcrypt_rounds", 12))
+        self.run_worker(self._refill_salts, thread=True, group="salts")
+        return salt
+
     def action_create_user(self) -> None:
-        """Create the user."""
-        name = self.query_one("#name", Input).value.strip()
-        email = self.query_one("#email", Input).value.strip()
-        phone = self.query_one("#phone", Input).value.strip()
-        role_select = self.query_one("#role", Select)
-        password = self.query_one("#password", Input).value
-
-        if not all([name, email, phone, password]):
+        """Validate the form and create the user; ignored while a create runs."""
+        if self._submitting:
             return
 
-        role_value = role_select.value
-        if role_value == Select.BLANK:
-            role: Literal["Customer", "Specialist", "Admin"] = "Customer"
-        else:
-            role = cast(Literal["Customer", "Specialist", "Admin"], str(role_value))
+        name = self._inputs["name"].value.strip()
+        email = self._inputs["email"].value.strip()
+        phone = self._inputs["phone"].value.strip()
+        password = self._inputs["password"].value
 
-        # Hash password with bcrypt
-        password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        error = _validate_signup(name, email, phone, password)
+        if error:
+            self.notify(error, severity="error")
+            return
 
-        user = UserCreate(
+        role_value = self._role_select.value if self._role_select else None
+        role = cast(
+            Literal["Customer", "Specialist", "Admin"],
+            "Customer"
+            if role_value in (None, Select.BLANK)
+            else str(getattr(role_value, "value", role_value)),
+        )
+
+        # The form already enforces every UserCreate constraint (non-empty
+        # fields, input max lengths, password length, role options).
+        user = UserCreate.model_construct(
             name=name, email=email, phone=phone, role=role, password=password
         )
+        self._submitting = True
+        self.notify("Creating user...")
+        self.run_worker(
+            self._handle_create(user, password, self._take_salt()), exclusive=True
+        )
 
+    async def _handle_create(
+        self, user: UserCreate, password: str, salt: bytes
+    ) -> None:
+        """Hash the password and insert the user on worker threads."""
         try:
-            create_user(user, password_hash)
-            self.app.pop_screen()
-        except Exception:
-            pass
+            password_hash = await asyncio.to_thread(_hash_password, password, salt)
+            await asyncio.to_thread(create_user, user, password_hash)
+        except Exception as e:
+            self.notify(f"Failed to create user: {e}", severity="error")
+            return
+        finally:
+            self._submitting = False
+
+        self.app.pop_screen()
 
     def action_go_back(self) -> None:
         """Go back."""
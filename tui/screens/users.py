@@ -1,17 +1,48 @@
 """Users management screen (Admin only)."""
 
+import operator
+
+from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Input, Label, Select, Static
 
 from database.queries import (
     delete_user,
     list_users,
 )
+from models import UserRow
+from tui.screens._signup_common import _UserImportMixin
+from tui.screens._table_common import (
+    _PAGE_SIZE,
+    _SIDEBAR_DIVIDER,
+    _PagedTable,
+    _row_key_id,
+)
+from tui.screens.user_edit import UserEditScreen
+from tui.screens.user_new import UserNewScreen
+
+_SEARCH_DEBOUNCE = 0.2
+_USER_CELLS = operator.attrgetter("name", "email", "phone", "role")
+
+
+def _fetch_user_page(
+    role: str | None = None, search: str | None = None, after_id: int | None = None
+) -> list[UserRow]:
+    """Query a page of users as lightweight rows (thread-safe)."""
+    return list_users(
+        role=role, search=search, limit=_PAGE_SIZE, after_id=after_id, as_tuples=True
+    )
+
+
+def _user_cells(user: UserRow) -> tuple[str, ...]:
+    """Format a user as a users table row."""
+    return (str(user.user_id), *_USER_CELLS(user))
 
 
-class UsersScreen(Screen):
+class UsersScreen(_UserImportMixin, Screen):
     """Users management screen."""
 
     CSS_PATH = "../css/main.tcss"
@@ -19,22 +50,28 @@ class UsersScreen(Screen):
     BINDINGS = [
         ("escape", "go_back", "Back"),
         ("n", "new_user", "New User"),
+        ("i", "import_users", "Import CSV"),
         ("q", "logout", "Logout"),
     ]
 
     def __init__(self) -> None:
-        self.users: list = []
         self.selected_user_id: int | None = None
+        self._search_timer: Timer | None = None
+        self._users: _PagedTable | None = None
+        self._table: DataTable | None = None
+        self._search_input: Input | None = None
+        self._role_select: Select | None = None
         super().__init__()
 
     def compose(self) -> ComposeResult:
         with Container(classes="sidebar"):
             yield Label("Users", classes="sidebar-title")
-            yield Static("─" * 18)
+            yield Static(_SIDEBAR_DIVIDER)
             with Container(classes="sidebar-menu"):
                 yield Button("Back", id="btn-back", classes="sidebar-button")
                 yield Button("Refresh", id="btn-refresh", classes="sidebar-button")
                 yield Button("New User", id="btn-new", variant="primary")
+                yield Button("Import CSV", id="btn-import", classes="sidebar-button")
                 yield Button("Edit", id="btn-edit", classes="sidebar-button")
                 yield Button("Delete", id="btn-delete", variant="error")
 
@@ -65,31 +102,38 @@ class UsersScreen(Screen):
 
             # Users table
             table = DataTable(id="users-table")
-            table.add_columns("ID", "Name", "Email", "Phone", "Role")
+            table.add_column("ID", key="id")
+            table.add_columns("Name", "Email", "Phone", "Role")
             table.cursor_type = "row"
             yield table
 
     def on_mount(self) -> None:
-        """Load users when screen mounts."""
-        self._load_users()
-
-    def _load_users(self, role: str = "", search: str = "") -> None:
-        """Load users into table."""
-        table = self.query_one("#users-table", DataTable)
-        table.clear()
-
-        role_filter = role if role else None
-        self.users = list_users(role=role_filter, search=search if search else None)
+        """Cache widgets and load users when screen mounts."""
+        self._table = self.query_one("#users-table", DataTable)
+        self._search_input = self.query_one("#search-input", Input)
+        self._role_select = self.query_one("#role-filter", Select)
+        self._users = _PagedTable(
+            self._table, _fetch_user_page, _user_cells, "user_id", reconcile=True
+        )
+        self.run_worker(self._load_users())
+
+    async def _load_users(self, role: str = "", search: str = "") -> None:
+        """Show the first page of users for the given filters."""
+        loaded = await self._users.load(
+            role=role if role else None, search=search if search else None
+        )
+        if loaded and self.selected_user_id not in self._users.records:
+            self.selected_user_id = None
 
-        for user in self.users:
-            table.add_row(
-                str(user.user_id), user.name, user.email, user.phone, user.role
-            )
+    @on(DataTable.RowHighlighted, "#users-table")
+    def on_users_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Load the next page when the cursor reaches the last loaded row."""
+        if self._users.wants_more(event.cursor_row):
+            self.run_worker(self._users.load_more())
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection."""
-        row_data = event.data_table.get_row(event.row_key)
-        self.selected_user_id = int(row_data[0])
+        self.selected_user_id = _row_key_id(event.row_key)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -98,9 +142,11 @@ class UsersScreen(Screen):
         if btn_id == "btn-back":
             self.action_go_back()
         elif btn_id == "btn-refresh":
-            self._load_users()
+            self.run_worker(self._load_users())
         elif btn_id == "btn-new":
             self.action_new_user()
+        elif btn_id == "btn-import":
+            self.action_import_users()
         elif btn_id == "btn-search":
             self._handle_search()
         elif btn_id == "btn-edit":
@@ -113,28 +159,38 @@ class UsersScreen(Screen):
         if event.select.id == "role-filter":
             value = event.value
             role = str(value) if value != Select.BLANK else ""
-            self._load_users(role=role)
+            self.run_worker(self._load_users(role=role))
+
+    @on(Input.Changed, "#search-input")
+    def on_search_changed(self, event: Input.Changed) -> None:
+        """Filter as the user types, debounced so a burst issues one query."""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(_SEARCH_DEBOUNCE, self._handle_search)
 
     def _handle_search(self) -> None:
         """Handle search."""
-        search = self.query_one("#search-input", Input).value
-        role_filter = self.query_one("#role-filter", Select)
-        role = str(role_filter.value) if role_filter.value != Select.BLANK else ""
-        self._load_users(role=role, search=search)
+        search = self._search_input.value
+        role_value = self._role_select.value
+        role = str(role_value) if role_value != Select.BLANK else ""
+        self.run_worker(self._load_users(role=role, search=search))
 
     def _handle_edit(self) -> None:
         """Handle edit button."""
         if self.selected_user_id:
-            self.app.push_screen(f"user_edit:{self.selected_user_id}")
+            self.app.push_screen(UserEditScreen(self.selected_user_id))
 
     def _handle_delete(self) -> None:
         """Delete selected user."""
         if not self.selected_user_id:
             return
 
-        if delete_user(self.selected_user_id):
-            self._load_users()
-            self.selected_user_id = None
+        user_id = self.selected_user_id
+        if not delete_user(user_id):
+            return
+
+        self.selected_user_id = None
+        self._users.remove(user_id)
 
     def action_go_back(self) -> None:
         """Go back to dashboard."""
@@ -149,4 +205,4 @@ class UsersScreen(Screen):
 
     def action_new_user(self) -> None:
         """Open new user dialog."""
-        self.app.push_screen("user_new")
+        self.app.push_screen(UserNewScreen())
@@ -1,5 +1,8 @@
 """Unified workspace screen with tabbed interface for Products, Orders, and Services."""
 
+import asyncio
+import time
+
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container
@@ -20,17 +23,98 @@ from database.queries import (
     get_order_by_id,
     get_product_by_id,
     get_service_request_by_id,
-    list_orders,
+    list_order_rows,
     list_product_categories,
     list_products,
-    list_service_requests,
-    list_service_requests_for_specialist,
+    list_service_request_rows,
     update_order_status,
     update_service_request_status,
 )
-from models import OrderUpdateStatus, ServiceRequestUpdateStatus
+from models import OrderUpdateStatus, ServiceRequestUpdateStatus, SessionUser
 from tui.dialogs import ConfirmDialog, ShortcutsBar
+from tui.screens._table_common import _PAGE_SIZE, _PagedTable, _row_key_id
+from tui.screens.order_new import OrderNewScreen
+from tui.screens.orders import _order_cells
 from tui.screens.product_edit import ProductEditScreen
+from tui.screens.product_new import ProductNewScreen
+from tui.screens.products import _product_cells
+from tui.screens.service_new import ServiceNewScreen
+from tui.screens.services import _request_cells
+
+_SEARCH_DEBOUNCE = 0.3
+# Other processes may edit the catalogue, so cached categories also expire.
+_CATEGORIES_TTL = 60.0
+# Per-tab action config: the data kind it shows, the screen class "n" opens and
+# the roles that may not open it, and the cancel/complete handlers (if any).
+_TAB_ACTIONS: dict[str, dict] = {
+    "products": {
+        "kind": "products",
+        "new_screen": ProductNewScreen,
+        "new_denied": (None, "Customer"),
+    },
+    "orders": {
+        "kind": "orders",
+        "new_screen": OrderNewScreen,
+        "new_denied": ("Specialist",),
+        "cancel": "_handle_order_cancel",
+        "complete": "_handle_order_complete",
+    },
+    "services": {
+        "kind": "requests",
+        "new_screen": ServiceNewScreen,
+        "new_denied": ("Specialist",),
+        "cancel": "_handle_service_cancel",
+        "complete": "_handle_service_complete",
+    },
+}
+
+
+def _get_order_summary(order_id: int):
+    """Fetch an order without its items, enough to check owner and status."""
+    return get_order_by_id(order_id, with_items=False)
+
+
+def _build_shortcuts(active_tab: str, role: str | None) -> str:
+    """Build the shortcuts bar text for a tab and user role."""
+    is_customer = role == "Customer"
+    is_specialist = role == "Specialist"
+
+    shortcuts = []
+    shortcuts.append(
+        "\\[Alt+1]Products \\[Alt+2]Orders \\[Alt+3]Services \\[Alt+4]Profile"
+    )
+    shortcuts.append("\\[Esc]Back \\[/]Search")
+
+    if active_tab == "products":
+        if not is_customer:
+            shortcuts.append("\\[n]New \\[e]Edit \\[d]Delete")
+        shortcuts.append("\\[r]Refresh")
+    elif active_tab == "orders":
+        if not is_specialist:
+            shortcuts.append("\\[n]New")
+        if not is_customer:
+            shortcuts.append("\\[c]Complete")
+        if not is_specialist:
+            shortcuts.append("\\[x]Cancel")
+        shortcuts.append("\\[r]Refresh")
+    elif active_tab == "services":
+        if not is_specialist:
+            shortcuts.append("\\[n]New")
+        if is_specialist:
+            shortcuts.append("\\[c]Complete \\[a]Assign")
+        elif not is_customer:
+            shortcuts.append("\\[c]Complete")
+        shortcuts.append("\\[r]Refresh")
+
+    return "  |  ".join(shortcuts)
+
+
+# Shortcut bar text per (active tab, user role), built once at import.
+_SHORTCUTS: dict[tuple[str, str | None], str] = {
+    (tab, role): _build_shortcuts(tab, role)
+    for tab in _TAB_ACTIONS
+    for role in (None, "Customer", "Specialist", "Admin")
+}
 
 
 class WorkspaceScreen(Screen):
@@ -57,15 +141,27 @@ class WorkspaceScreen(Screen):
     ]
 
     def __init__(self, initial_tab: str = "products") -> None:
-        self.products: list = []
-        self.orders: list = []
-        self.requests: list = []
         self.categories: list[str] = []
         self.selected_product_id: int | None = None
         self.selected_order_id: int | None = None
         self.selected_request_id: int | None = None
         self.current_status_filter: str | None = None
         self._initial_tab = initial_tab
+        # Data kinds whose tab has been shown; the rest load on first visit.
+        self._loaded_tabs: set[str] = {_TAB_ACTIONS[initial_tab]["kind"]}
+        # Loaded rows per data kind, keyed by record ID.
+        self._pages: dict[str, _PagedTable] = {}
+        self._shown_keys: dict[str, tuple] = {}
+        self._categories_stamp: int | None = None
+        # Signed-in user, cached at mount; logout clears the screen stack.
+        self._user: SessionUser | None = None
+        self._role: str | None = None
+        self._tables: dict[str, DataTable] = {}
+        self._search_inputs: dict[str, Input] = {}
+        self._tabbed: TabbedContent | None = None
+        self._shortcuts_bar: ShortcutsBar | None = None
+        self._category_select: Select | None = None
+        self._services_status: Select | None = None
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -151,222 +247,271 @@ class WorkspaceScreen(Screen):
 
             yield ShortcutsBar(id="shortcuts-bar", classes="shortcuts-bar")
 
-    def on_mount(self) -> None:
-        """Load data when screen mounts."""
-        self._load_categories()
-        self._load_products()
-        self._load_orders()
-        self._load_requests()
-        self._update_ui_for_role()
+    async def on_mount(self) -> None:
+        """Load data when screen mounts, querying all tabs concurrently."""
+        self._user = getattr(self.app, "current_user", None)
+        self._role = self._user.role if self._user else None
+        self._tables = {
+            "products": self.query_one("#products-table", DataTable),
+            "orders": self.query_one("#orders-table", DataTable),
+            "requests": self.query_one("#services-table", DataTable),
+        }
+        self._search_inputs = {
+            tab: self.query_one(f"#{tab}-search", Input)
+            for tab in ("products", "orders", "services")
+        }
+        self._tabbed = self.query_one(TabbedContent)
+        self._shortcuts_bar = self.query_one("#shortcuts-bar", ShortcutsBar)
+        self._category_select = self.query_one("#products-category", Select)
+        self._services_status = self.query_one("#services-status", Select)
+        self._pages = {
+            "products": _PagedTable(
+                self._tables["products"],
+                self._fetch_products,
+                _product_cells,
+                "product_id",
+            ),
+            "orders": _PagedTable(
+                self._tables["orders"], self._fetch_orders, _order_cells, "order_id"
+            ),
+            "requests": _PagedTable(
+                self._tables["requests"],
+                self._fetch_requests,
+                _request_cells,
+                "request_id",
+            ),
+        }
         self._update_shortcuts()
 
-    def _update_ui_for_role(self) -> None:
-        """Update UI based on user role."""
-        current_user = getattr(self.app, "current_user", None)
-        if not current_user:
-            return
+        # Only the initial tab is loaded here; see on_tabbed_content_tab_activated.
+        kind = _TAB_ACTIONS[self._initial_tab]["kind"]
+        categories, _ = await asyncio.gather(
+            asyncio.to_thread(self._fetch_categories), self._load_tab(kind, {})
+        )
+        self._populate_categories(categories)
 
-        _ = current_user.role
+    def on_screen_resume(self) -> None:
+        """Refresh the category dropdown if products changed while away
+        or the cached categories have expired.
+
+        Data may also have changed on other screens, so the next search or
+        filter change always reloads, even if it matches what is shown.
+        """
+        self._shown_keys.clear()
+        if self._categories_stamp is None:
+            return
+        cached = getattr(self.app, "cached_categories", None)
+        if (
+            self._categories_stamp != getattr(self.app, "categories_stamp", 0)
+            or cached is None
+            or time.monotonic() >= cached[1]
+        ):
+            self.run_worker(self._load_categories(), group="categories", exclusive=True)
 
     def _update_shortcuts(self) -> None:
         """Update shortcuts bar based on current tab and role."""
-        current_user = getattr(self.app, "current_user", None)
-        is_customer = current_user and current_user.role == "Customer"
-        is_specialist = current_user and current_user.role == "Specialist"
+        self._shortcuts_bar.shortcuts = _SHORTCUTS[(self._tabbed.active, self._role)]
+
+    async def _load_categories(self) -> None:
+        """Load product categories for the dropdown on a worker thread."""
+        self._populate_categories(await asyncio.to_thread(self._fetch_categories))
+
+    def _fetch_categories(self) -> list[str]:
+        """Get product categories, reusing the app-wide cache if still current."""
+        stamp = getattr(self.app, "categories_stamp", 0)
+        cached = getattr(self.app, "cached_categories", None)
+        now = time.monotonic()
+        if cached is not None and cached[0] == stamp and now < cached[1]:
+            categories = cached[2]
+        else:
+            categories = ["All Categories"] + list_product_categories()
+            self.app.cached_categories = (stamp, now + _CATEGORIES_TTL, categories)
+        self._categories_stamp = stamp
+        return categories
 
-        # Get active tab
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
+    def _populate_categories(self, categories: list[str]) -> None:
+        """Fill the category dropdown, unless it already lists ``categories``.
 
-        shortcuts = []
-        shortcuts.append(
-            "\\[Alt+1]Products \\[Alt+2]Orders \\[Alt+3]Services \\[Alt+4]Profile"
-        )
-        shortcuts.append("\\[Esc]Back \\[/]Search")
-
-        if active_tab == "products":
-            if not is_customer:
-                shortcuts.append("\\[n]New \\[e]Edit \\[d]Delete")
-            shortcuts.append("\\[r]Refresh")
-        elif active_tab == "orders":
-            if not is_specialist:
-                shortcuts.append("\\[n]New")
-            if not is_customer:
-                shortcuts.append("\\[c]Complete")
-            if not is_specialist:
-                shortcuts.append("\\[x]Cancel")
-            shortcuts.append("\\[r]Refresh")
-        elif active_tab == "services":
-            if not is_specialist:
-                shortcuts.append("\\[n]New")
-            if is_specialist:
-                shortcuts.append("\\[c]Complete \\[a]Assign")
-            elif not is_customer:
-                shortcuts.append("\\[c]Complete")
-            shortcuts.append("\\[r]Refresh")
-
-        shortcuts_bar = self.query_one("#shortcuts-bar", ShortcutsBar)
-        shortcuts_bar.shortcuts = "  |  ".join(shortcuts)
-
-    def _load_categories(self) -> None:
-        """Load product categories for dropdown."""
-        self.categories = ["All Categories"] + list_product_categories()
-        select = self.query_one("#products-category", Select)
-        select.set_options([(c, c) for c in self.categories])
-
-    def _load_products(self, search: str = "", category: str = "") -> None:
-        """Load products into table."""
-        table = self.query_one("#products-table", DataTable)
-        table.clear()
+        Rebuilding the options also clears the user's current selection.
+        """
+        if categories == self.categories:
+            return
+        self.categories = categories
+        self._category_select.set_options([(c, c) for c in self.categories])
 
+    def _fetch_products(
+        self, search: str = "", category: str = "", after_id: int | None = None
+    ) -> list:
+        """Query a page of products (safe to run on a worker thread)."""
         cat_filter = None if category in ("", "All Categories") else category
-        self.products = list_products(
-            category=cat_filter, search=search if search else None
+        return list_products(
+            category=cat_filter,
+            search=search if search else None,
+            limit=_PAGE_SIZE,
+            after_id=after_id,
         )
 
-        for product in self.products:
-            table.add_row(
-                str(product.product_id),
-                product.name,
-                product.category,
-                f"${product.price:.2f}",
-            )
-
-    def _load_orders(self, search: str = "") -> None:
-        """Load orders into table."""
-        table = self.query_one("#orders-table", DataTable)
-        table.clear()
+    def _fetch_orders(self, search: str = "", after_id: int | None = None) -> list:
+        """Query a page of orders visible to the current user (thread-safe)."""
+        user_id = self._user.user_id if self._role == "Customer" else None
 
-        current_user = getattr(self.app, "current_user", None)
-        user_id = None
-        if current_user and current_user.role == "Customer":
-            user_id = current_user.user_id
-
-        self.orders = list_orders(
+        return list_order_rows(
             user_id=user_id,
             status=self.current_status_filter,
             search=search if search else None,
+            limit=_PAGE_SIZE,
+            after_id=after_id,
         )
 
-        for order in self.orders:
-            item_count = len(order.items)
-            table.add_row(
-                str(order.order_id),
-                str(order.order_date)[:16] if order.order_date else "",
-                order.customer_name or "Unknown",
-                f"${order.total_price:.2f}" if order.total_price else "$0.00",
-                f"{item_count} items",
-                order.status,
+    def _fetch_requests(
+        self, status: str = "", search: str = "", after_id: int | None = None
+    ) -> list:
+        """Query a page of service requests for the current role (thread-safe)."""
+        status_filter = status if status else None
+
+        if not self._user:
+            return []
+        if self._role == "Customer":
+            return list_service_request_rows(
+                status=status_filter,
+                customer_id=self._user.user_id,
+                search=search if search else None,
+                limit=_PAGE_SIZE,
+                after_id=after_id,
             )
+        if self._role == "Specialist":
+            return list_service_request_rows(
+                status=status_filter,
+                available_to_specialist=self._user.user_id,
+                search=search if search else None,
+                limit=_PAGE_SIZE,
+                after_id=after_id,
+            )
+        return list_service_request_rows(
+            status=status_filter,
+            search=search if search else None,
+            limit=_PAGE_SIZE,
+            after_id=after_id,
+        )
 
-    def _load_requests(self, status: str = "", search: str = "") -> None:
-        """Load service requests based on user role."""
-        table = self.query_one("#services-table", DataTable)
-        table.clear()
+    def _schedule_reload(self, kind: str, **filters: str) -> None:
+        """Reload one tab after a short pause, superseding any pending reload.
 
-        current_user = getattr(self.app, "current_user", None)
-        status_filter = status if status else None
+        Each tab has its own exclusive worker group, so a newer search or
+        filter change cancels the previous one before its results land. If
+        the filters match what the tab already shows, nothing is reloaded.
+        Tabs not yet shown are skipped: they load on their first visit, and
+        their filter selects fire Changed while mounting.
+        """
+        if kind not in self._loaded_tabs:
+            return
+        if self._reload_key(kind, filters) == self._shown_keys.get(kind):
+            self.workers.cancel_group(self, kind)
+            return
+        self.run_worker(
+            self._debounced_reload(kind, filters), group=kind, exclusive=True
+        )
 
-        if current_user:
-            if current_user.role == "Customer":
-                self.requests = list_service_requests(
-                    status=status_filter,
-                    customer_id=current_user.user_id,
-                    search=search if search else None,
-                )
-            elif current_user.role == "Specialist":
-                self.requests = list_service_requests_for_specialist(
-                    current_user.user_id
-                )
-                if status_filter:
-                    self.requests = [
-                        r for r in self.requests if r.status == status_filter
-                    ]
-            else:
-                self.requests = list_service_requests(
-                    status=status_filter, search=search if search else None
-                )
-        else:
-            self.requests = []
-
-        for req in self.requests:
-            specialist = req.specialist_name or "Unassigned"
-            table.add_row(
-                str(req.request_id),
-                str(req.request_date)[:16] if req.request_date else "",
-                req.service_type,
-                req.status,
-                req.customer_name,
-                specialist,
-            )
+    async def _load_tab(self, kind: str, filters: dict[str, str]) -> None:
+        """Show a tab's first page for ``filters``, unless a newer load started."""
+        if await self._pages[kind].load(**filters):
+            self._shown_keys[kind] = self._reload_key(kind, filters)
+
+    async def _refresh_tab(self, kind: str) -> None:
+        """Re-query a tab's unfiltered first page on a worker thread."""
+        await self._load_tab(kind, {})
+
+    async def _loaded_row(self, kind: str, row_id: int, fetch):
+        """Return a tab's loaded row by ID, querying with ``fetch`` on a miss.
+
+        Loaded rows may be stale, so status changes must still be guarded
+        in SQL; they are only used to reject obviously invalid actions.
+        """
+        row = self._pages[kind].records.get(row_id)
+        if row is None:
+            row = await asyncio.to_thread(fetch, row_id)
+        return row
+
+    def _reload_key(self, kind: str, filters: dict[str, str]) -> tuple:
+        """Identify a tab's query: the user, its non-empty filters and status."""
+        return (
+            self._user.user_id if self._user else None,
+            tuple(sorted((k, v) for k, v in filters.items() if v)),
+            self.current_status_filter if kind == "orders" else None,
+        )
 
-    def _get_selected_id_from_table(self, table_id: str) -> int | None:
-        """Get ID from currently highlighted row in specified table."""
-        table = self.query_one(f"#{table_id}", DataTable)
-        if table.cursor_row is None:
-            return None
-        try:
-            row_data = table.get_row_at(table.cursor_row)
-            return int(row_data[0])
-        except (IndexError, ValueError):
-            return None
-
-    def _get_selected_product_id(self) -> int | None:
-        """Get product ID from currently highlighted row."""
-        return self._get_selected_id_from_table("products-table")
-
-    def _get_selected_order_id(self) -> int | None:
-        """Get order ID from currently highlighted row."""
-        return self._get_selected_id_from_table("orders-table")
-
-    def _get_selected_request_id(self) -> int | None:
-        """Get request ID from currently highlighted row."""
-        return self._get_selected_id_from_table("services-table")
+    async def _debounced_reload(self, kind: str, filters: dict[str, str]) -> None:
+        """Wait out the debounce delay, then fetch and show one tab's data."""
+        await asyncio.sleep(_SEARCH_DEBOUNCE)
+        await self._load_tab(kind, filters)
+
+    def _maybe_load_more(self, kind: str, cursor_row: int) -> None:
+        """Load a tab's next page when the cursor reaches its last loaded row."""
+        pages = self._pages[kind]
+        if pages.wants_more(cursor_row):
+            self.run_worker(pages.load_more())
 
     @on(DataTable.RowHighlighted, "#products-table")
     def on_products_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Track cursor movement in products table."""
-        self.selected_product_id = self._get_selected_product_id()
+        self.selected_product_id = _row_key_id(event.row_key)
+        self._maybe_load_more("products", event.cursor_row)
 
     @on(DataTable.RowHighlighted, "#orders-table")
     def on_orders_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Track cursor movement in orders table."""
-        self.selected_order_id = self._get_selected_order_id()
+        self.selected_order_id = _row_key_id(event.row_key)
+        self._maybe_load_more("orders", event.cursor_row)
 
     @on(DataTable.RowHighlighted, "#services-table")
     def on_services_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Track cursor movement in services table."""
-        self.selected_request_id = self._get_selected_request_id()
+        self.selected_request_id = _row_key_id(event.row_key)
+        self._maybe_load_more("requests", event.cursor_row)
 
-    def on_tabbed_content_tab_activated(self) -> None:
-        """Update shortcuts when tab changes."""
+    def on_tabbed_content_tab_activated(
+        self, event: TabbedContent.TabActivated
+    ) -> None:
+        """Update shortcuts, and load the tab's data on its first visit."""
         self._update_shortcuts()
+        kind = _TAB_ACTIONS[event.pane.id]["kind"]
+        if kind not in self._loaded_tabs:
+            self._loaded_tabs.add(kind)
+            self.run_worker(self._refresh_tab(kind), group=kind, exclusive=True)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle search input submission."""
-        if event.input.id == "products-search":
-            search = event.value
-            category_select = self.query_one("#products-category", Select)
-            category = (
-                str(category_select.value)
-                if category_select.value != Select.BLANK
-                else ""
-            )
-            self._load_products(search=search, category=category)
-        elif event.input.id == "orders-search":
-            search = event.value
-            self._load_orders(search=search)
-        elif event.input.id == "services-search":
-            search = event.value
-            status_select = self.query_one("#services-status", Select)
+        self._search_from_input(event.input)
+
+    @on(Input.Changed, "#products-search, #orders-search, #services-search")
+    def on_search_changed(self, event: Input.Changed) -> None:
+        """Search incrementally as the user types."""
+        self._search_from_input(event.input)
+
+    def _search_from_input(self, search_input: Input) -> None:
+        """Schedule a debounced reload of the tab owning ``search_input``."""
+        search = search_input.value
+        if search_input.id == "products-search":
+            # An untouched Select holds Select.NULL, which is not Select.BLANK
+            category_select = self._category_select
+            category = "" if category_select.is_blank() else str(category_select.value)
+            if category == "All Categories":
+                category = ""
+            self._schedule_reload("products", search=search, category=category)
+        elif search_input.id == "orders-search":
+            self._schedule_reload("orders", search=search)
+        elif search_input.id == "services-search":
+            status_select = self._services_status
             status = (
                 str(status_select.value) if status_select.value != Select.BLANK else ""
             )
-            self._load_requests(status=status, search=search)
+            self._schedule_reload("requests", status=status, search=search)
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle filter changes."""
-        if event.select.id == "orders-status":
+        if event.select.id == "products-category":
+            self._search_from_input(self._search_inputs["products"])
+        elif event.select.id == "orders-status":
             selected_value = event.value
             if selected_value is None or str(selected_value) == "NoSelection":
                 self.current_status_filter = None
@@ -374,16 +519,15 @@ class WorkspaceScreen(Screen):
                 self.current_status_filter = (
                     str(selected_value) if selected_value else None
                 )
-            self._load_orders()
+            self._schedule_reload("orders")
         elif event.select.id == "services-status":
             value = event.value
             status = str(value) if value != Select.BLANK else ""
-            self._load_requests(status=status)
+            self._schedule_reload("requests", status=status)
 
     def action_switch_tab(self, tab_id: str) -> None:
         """Switch to specified tab."""
-        tabbed = self.query_one(TabbedContent)
-        tabbed.active = tab_id
+        self._tabbed.active = tab_id
 
     def action_go_back(self) -> None:
         """Go back to dashboard."""
@@ -399,151 +543,121 @@ class WorkspaceScreen(Screen):
 
     def action_focus_search(self) -> None:
         """Focus the search input of current tab."""
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
-
-        if active_tab == "products":
-            search_input = self.query_one("#products-search", Input)
-            search_input.focus()
-        elif active_tab == "orders":
-            search_input = self.query_one("#orders-search", Input)
-            search_input.focus()
-        elif active_tab == "services":
-            search_input = self.query_one("#services-search", Input)
+        search_input = self._search_inputs.get(self._tabbed.active)
+        if search_input is not None:
             search_input.focus()
 
     def action_new_item(self) -> None:
         """Create new item based on current tab."""
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
-
-        current_user = getattr(self.app, "current_user", None)
-        is_specialist = current_user and current_user.role == "Specialist"
-
-        if active_tab == "products":
-            if not current_user or current_user.role == "Customer":
-                return
-            self.app.push_screen("product_new")
-        elif active_tab == "orders":
-            if is_specialist:
-                return
-            self.app.push_screen("order_new")
-        elif active_tab == "services":
-            if is_specialist:
-                return
-            self.app.push_screen("service_new")
+        cfg = _TAB_ACTIONS[self._tabbed.active]
+        if self._role in cfg["new_denied"]:
+            return
+        self.app.push_screen(cfg["new_screen"]())
 
     def action_edit_item(self) -> None:
         """Edit selected item."""
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
+        active_tab = self._tabbed.active
 
         if active_tab == "products" and self.selected_product_id:
-            current_user = getattr(self.app, "current_user", None)
-            if not current_user or current_user.role == "Customer":
+            if self._role in (None, "Customer"):
                 return
             self.app.push_screen(ProductEditScreen(self.selected_product_id))
 
     def action_delete_item(self) -> None:
         """Delete selected item."""
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
+        active_tab = self._tabbed.active
 
         if active_tab == "products" and self.selected_product_id:
-            current_user = getattr(self.app, "current_user", None)
-            if not current_user or current_user.role == "Customer":
+            if self._role in (None, "Customer"):
                 return
 
-            product_id = self.selected_product_id
-            product = get_product_by_id(product_id)
-            if not product:
-                return
+            self.run_worker(
+                self._confirm_delete_product(self.selected_product_id), group="db"
+            )
 
-            def confirm_delete(confirmed: bool) -> None:
-                if confirmed:
-                    if delete_product(product_id):
-                        self._load_products()
-                        self.selected_product_id = None
-
-            # Use a simple confirmation approach
-            self.app.push_screen(
-                ConfirmDialog(
-                    title="Confirm Delete",
-                    message=f"Delete product '{product.name}'?",
-                    on_confirm=confirm_delete,
-                )
+    async def _confirm_delete_product(self, product_id: int) -> None:
+        """Ask for confirmation, then delete the product."""
+        product = await self._loaded_row("products", product_id, get_product_by_id)
+        if not product:
+            return
+
+        def confirm_delete(confirmed: bool) -> None:
+            if confirmed:
+                self.run_worker(self._delete_product(product_id), group="db")
+
+        # Use a simple confirmation approach
+        self.app.push_screen(
+            ConfirmDialog(
+                title="Confirm Delete",
+                message=f"Delete product '{product.name}'?",
+                on_confirm=confirm_delete,
             )
+        )
+
+    async def _delete_product(self, product_id: int) -> None:
+        """Delete a product and reload the products tab."""
+        if await asyncio.to_thread(delete_product, product_id):
+            self.app.categories_stamp += 1
+            await self._refresh_tab("products")
+            self.selected_product_id = None
 
     def action_refresh(self) -> None:
         """Refresh current tab data."""
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
-
-        if active_tab == "products":
-            self._load_products()
-        elif active_tab == "orders":
-            self._load_orders()
-        elif active_tab == "services":
-            self._load_requests()
+        kind = _TAB_ACTIONS[self._tabbed.active]["kind"]
+        self.run_worker(self._refresh_tab(kind), group=kind, exclusive=True)
 
     def action_cancel_item(self) -> None:
         """Cancel selected item based on context."""
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
-        current_user = getattr(self.app, "current_user", None)
-
-        if not current_user:
-            return
-
-        if active_tab == "orders" and self.selected_order_id:
-            self._handle_order_cancel(current_user)
-        elif active_tab == "services" and self.selected_request_id:
-            self._handle_service_cancel(current_user)
+        self._run_tab_handler("cancel")
 
     def action_complete_item(self) -> None:
         """Complete selected item based on context."""
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
-        current_user = getattr(self.app, "current_user", None)
+        self._run_tab_handler("complete")
 
-        if not current_user:
+    def _run_tab_handler(self, action: str) -> None:
+        """Run the current tab's handler for ``action`` if a row is selected."""
+        if not self._user:
             return
 
-        if active_tab == "orders" and self.selected_order_id:
-            self._handle_order_complete(current_user)
-        elif active_tab == "services" and self.selected_request_id:
-            self._handle_service_complete(current_user)
+        cfg = _TAB_ACTIONS[self._tabbed.active]
+        selected = {
+            "orders": self.selected_order_id,
+            "requests": self.selected_request_id,
+        }.get(cfg["kind"])
+        if action in cfg and selected:
+            handler = getattr(self, cfg[action])
+            self.run_worker(handler(self._user), group="db")
 
-    def _handle_order_cancel(self, current_user) -> None:
+    async def _handle_order_cancel(self, current_user) -> None:
         """Cancel selected order."""
         order_id = self.selected_order_id
         if order_id is None:
             return
 
-        order = get_order_by_id(order_id)
+        order = await self._loaded_row("orders", order_id, _get_order_summary)
         if not order:
             return
 
         if current_user.role == "Customer":
             if order.user_id != current_user.user_id or order.status != "Pending":
                 return
-            if cancel_order(order_id):
-                self._load_orders()
+            if await asyncio.to_thread(cancel_order, order_id):
+                await self._refresh_tab("orders")
                 self.selected_order_id = None
         elif current_user.role in ["Specialist", "Admin"]:
             if order.status != "Pending":
                 return
-            if cancel_order(order_id):
-                self._load_orders()
+            if await asyncio.to_thread(cancel_order, order_id):
+                await self._refresh_tab("orders")
                 self.selected_order_id = None
 
-    def _handle_order_complete(self, current_user) -> None:
+    async def _handle_order_complete(self, current_user) -> None:
         """Complete selected order."""
         order_id = self.selected_order_id
         if order_id is None:
             return
 
-        order = get_order_by_id(order_id)
+        order = await self._loaded_row("orders", order_id, _get_order_summary)
         if not order:
             return
 
@@ -552,11 +666,11 @@ class WorkspaceScreen(Screen):
         if order.status != "Pending":
             return
         update = OrderUpdateStatus(status="Completed")
-        if update_order_status(order_id, update):
-            self._load_orders()
+        if await asyncio.to_thread(update_order_status, order_id, update, ("Pending",)):
+            await self._refresh_tab("orders")
             self.selected_order_id = None
 
-    def _handle_service_cancel(self, current_user) -> None:
+    async def _handle_service_cancel(self, current_user) -> None:
         """Cancel selected service request."""
         request_id = self.selected_request_id
         if request_id is None:
@@ -567,7 +681,9 @@ class WorkspaceScreen(Screen):
             self.notify("Permission denied", severity="error")
             return
 
-        request = get_service_request_by_id(request_id)
+        request = await self._loaded_row(
+            "requests", request_id, get_service_request_by_id
+        )
         if not request:
             self.notify("Service request not found", severity="error")
             return
@@ -577,17 +693,20 @@ class WorkspaceScreen(Screen):
                 "Can only cancel Pending or In Progress requests", severity="error"
             )
             return
-        success = update_service_request_status(
-            request_id, ServiceRequestUpdateStatus(status="Cancelled")
+        success = await asyncio.to_thread(
+            update_service_request_status,
+            request_id,
+            ServiceRequestUpdateStatus(status="Cancelled"),
+            ("Pending", "In Progress"),
         )
         if success:
             self.notify("Service request cancelled", severity="information")
         else:
             self.notify("Failed to cancel service request", severity="error")
-        self._load_requests()
+        await self._refresh_tab("requests")
         self.selected_request_id = None
 
-    def _handle_service_complete(self, current_user) -> None:
+    async def _handle_service_complete(self, current_user) -> None:
         """Complete selected service request."""
         request_id = self.selected_request_id
         if request_id is None:
@@ -598,7 +717,9 @@ class WorkspaceScreen(Screen):
             self.notify("Permission denied", severity="error")
             return
 
-        request = get_service_request_by_id(request_id)
+        request = await self._loaded_row(
+            "requests", request_id, get_service_request_by_id
+        )
         if not request:
             self.notify("Service request not found", severity="error")
             return
@@ -609,22 +730,31 @@ class WorkspaceScreen(Screen):
                 severity="error",
             )
             return
-        success = update_service_request_status(
-            request_id, ServiceRequestUpdateStatus(status="Completed")
+        success = await asyncio.to_thread(
+            update_service_request_status,
+            request_id,
+            ServiceRequestUpdateStatus(status="Completed"),
+            ("Pending", "In Progress"),
         )
         if success:
             self.notify("Service request completed", severity="information")
         else:
             self.notify("Failed to complete service request", severity="error")
-        self._load_requests()
+        await self._refresh_tab("requests")
         self.selected_request_id = None
 
     def action_assign_request(self) -> None:
         """Assign service request to current specialist."""
-        current_user = getattr(self.app, "current_user", None)
-        if not current_user or current_user.role != "Specialist":
+        if self._role != "Specialist":
             return
 
         if self.selected_request_id:
-            assign_specialist(self.selected_request_id, current_user.user_id)
-            self._load_requests()
+            self.run_worker(
+                self._assign_request(self.selected_request_id, self._user.user_id),
+                group="db",
+            )
+
+    async def _assign_request(self, request_id: int, specialist_id: int) -> None:
+        """Assign a request to a specialist and reload the services tab."""
+        await asyncio.to_thread(assign_specialist, request_id, specialist_id)
+        await self._refresh_tab("requests")